@@ -44,6 +44,13 @@ _ICON_CLIP = "\U0001f4cb"  # clipboard
 _ICON_LINK = "\U0001f4ce"  # paperclip
 _ICON_UNKNOWN = "\u2753"  # question mark
 
+# Job status -> icon lookup for /list rows
+_STATUS_ICONS = {
+    "completed": _ICON_OK,
+    "processing": _ICON_WAIT,
+    "failed": _ICON_FAIL,
+}
+
 
 def _get_notion_client() -> Optional[NotionClient]:
     """Create Notion client if configured"""
@@ -169,11 +176,7 @@ async def cmd_list(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
         lines = ["\ucd5c\uadfc Transcriptions:\n"]
         for i, page in enumerate(pages, 1):
-            status_icon = {
-                "completed": _ICON_OK,
-                "processing": _ICON_WAIT,
-                "failed": _ICON_FAIL,
-            }.get(page["status"], _ICON_UNKNOWN)
+            status_icon = _STATUS_ICONS.get(page["status"], _ICON_UNKNOWN)
             title = page["title"][:40]
             lines.append(f"{i}. {status_icon} {title}")
             if page.get("notion_url"):
@@ -4,15 +4,45 @@ Ports the daily version check logic from scribe.zsh to Python for Cloud Run
 """
 
 import logging
+import os
 import subprocess
 import asyncio
 from datetime import date
 from pathlib import Path
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 VERSION_CHECK_FILE = Path("/tmp/.ytdlp_version_check")
 
+# In-memory copy of the last check date, keyed by the file's mtime so that
+# repeated requests on the same day skip the file read entirely
+_last_check: Optional[str] = None
+_last_check_mtime: float = 0.0
+
+
+def _read_last_check() -> Optional[str]:
+    """Return the recorded check date, re-reading the file only if it changed"""
+    global _last_check, _last_check_mtime
+    try:
+        mtime = VERSION_CHECK_FILE.stat().st_mtime
+    except FileNotFoundError:
+        return None
+    if _last_check is None or mtime != _last_check_mtime:
+        _last_check = VERSION_CHECK_FILE.read_text().strip()
+        _last_check_mtime = mtime
+    return _last_check
+
+
+def _write_last_check(today: str):
+    """Record the check date atomically and refresh the in-memory copy"""
+    global _last_check, _last_check_mtime
+    tmp_path = VERSION_CHECK_FILE.with_name(VERSION_CHECK_FILE.name + ".tmp")
+    tmp_path.write_text(today)
+    os.replace(tmp_path, VERSION_CHECK_FILE)
+    _last_check = today
+    _last_check_mtime = VERSION_CHECK_FILE.stat().st_mtime
+
 
 def _get_current_version() -> str:
     """Get currently installed yt-dlp version"""
@@ -31,7 +61,9 @@ def _do_update() -> tuple[str, str, bool]:
     try:
         result = subprocess.run(
             ["uv", "pip", "install", "--upgrade", "--resolution=highest", "yt-dlp"],
-            capture_output=True,
+            # Install progress is discarded; stderr is kept for the failure log
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             timeout=120,
         )
@@ -53,6 +85,23 @@ def _do_update() -> tuple[str, str, bool]:
         return old_version, old_version, False
 
 
+def _version_if_checked(today: str) -> Optional[str]:
+    """Return the installed version if today's check already ran, else None"""
+    if _read_last_check() != today:
+        return None
+    return _get_current_version()
+
+
+def _update_and_record(today: str) -> tuple[str, str, bool]:
+    """Run the update and record today's check"""
+    result = _do_update()
+    try:
+        _write_last_check(today)
+    except Exception as e:
+        logger.warning("Could not write version check file: %s", e)
+    return result
+
+
 async def check_and_update_ytdlp() -> str:
     """
     Check and update yt-dlp if needed (once per day).
@@ -62,24 +111,17 @@ async def check_and_update_ytdlp() -> str:
     """
     today = date.today().strftime("%Y%m%d")
 
-    # Check if already checked today
-    if VERSION_CHECK_FILE.exists():
-        last_check = VERSION_CHECK_FILE.read_text().strip()
-        if last_check == today:
-            version = _get_current_version()
-            logger.debug("yt-dlp already checked today (version: %s)", version)
-            return f"yt-dlp {version} (checked today)"
+    # Check if already checked today. The stat and the importlib.metadata
+    # scan both hit the disk, so run them off the event loop too
+    version = await asyncio.to_thread(_version_if_checked, today)
+    if version is not None:
+        logger.debug("yt-dlp already checked today (version: %s)", version)
+        return f"yt-dlp {version} (checked today)"
 
     logger.info("Checking yt-dlp version...")
 
-    # Run update in thread to avoid blocking
-    old_ver, new_ver, was_updated = await asyncio.to_thread(_do_update)
-
-    # Record today's check
-    try:
-        VERSION_CHECK_FILE.write_text(today)
-    except Exception as e:
-        logger.warning("Could not write version check file: %s", e)
+    # Run update (and record today's check) in thread to avoid blocking
+    old_ver, new_ver, was_updated = await asyncio.to_thread(_update_and_record, today)
 
     if was_updated:
         msg = f"yt-dlp updated: {old_ver} → {new_ver}"
@@ -4,6 +4,7 @@ Command-line interface for Open-Scribe
 
 import argparse
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -173,6 +174,38 @@ Environment variables for defaults:
     return parser
 
 
+def _write_env_value(path: Path, name: str, value: str) -> bool:
+    """.env 파일의 name=... 라인을 한 번의 치환으로 교체(없으면 추가)한다.
+
+    값이 이미 같으면 쓰지 않고, 쓸 때는 임시 파일에 쓴 뒤 os.replace로
+    교체해 동시에 읽는 쪽이 잘린 파일을 보지 않도록 한다.
+
+    Returns:
+        기존 라인을 교체했으면 True, 새로 추가했으면 False
+    """
+    text = path.read_text() if path.exists() else ""
+    new_line = f"{name}={value}"
+    pattern = re.compile(rf"(?m)^[ \t]*{re.escape(name)}=.*$")
+    new_text, count = pattern.subn(lambda _: new_line, text)
+    if not count:
+        separator = "" if not text or text.endswith("\n") else "\n"
+        new_text = f"{text}{separator}{new_line}\n"
+    if new_text != text:
+        tmp_path = path.with_name(path.name + ".tmp")
+        # 키가 디스크에 닿는 순간부터 0600이 되도록 생성 시점에 권한을 지정한다
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, "w") as f:
+                # 이전에 남은 .tmp가 있었다면 생성 모드가 적용되지 않으므로 다시 맞춘다
+                os.fchmod(f.fileno(), 0o600)
+                f.write(new_text)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    return count > 0
+
+
 def update_api_key() -> int:
     """OPENAI_API_KEY를 대화형으로 안전하게 교체한다.
 
@@ -209,15 +242,7 @@ def update_api_key() -> int:
             return 1
 
     for path in targets:
-        lines = path.read_text().splitlines() if path.exists() else []
-        replaced = False
-        for i, line in enumerate(lines):
-            if line.strip().startswith("OPENAI_API_KEY="):
-                lines[i] = f"OPENAI_API_KEY={key}"
-                replaced = True
-        if not replaced:
-            lines.append(f"OPENAI_API_KEY={key}")
-        path.write_text("\n".join(lines) + "\n")
+        replaced = _write_env_value(path, "OPENAI_API_KEY", key)
         os.chmod(path, 0o600)
         print(f"[OK] 교체 완료: {path}" + ("" if replaced else "  (키가 없어 새로 추가함)"))
 
@@ -409,7 +434,8 @@ def process_single_video(input_path: str, args, config: Config) -> bool:
             transcription = transcriber.transcribe(
                 audio_file, 
                 stream=args.stream,
-                return_timestamps=args.timestamp
+                return_timestamps=args.timestamp,
+                use_cache=not args.force  # --force also skips cached subtitle corrections
             )
         
         if not transcription or not transcription.strip():  # Check for empty transcription
@@ -433,7 +459,8 @@ def process_single_video(input_path: str, args, config: Config) -> bool:
             summary_text = existing_job.get('summary')
         else:
             print("\n[SUMMARY] Generating summary...")
-            summary_text = generate_summary(transcription, verbose=args.verbose)
+            summary_text = generate_summary(transcription, verbose=args.verbose, stream=args.stream,
+                                            use_cache=not args.force)
             if summary_text:
                 # Save summary to file
                 summary_path = config.TRANSCRIPT_PATH / f"{safe_title}_summary.txt"
@@ -68,6 +68,8 @@ class Config:
     CACHE_DIR = CACHE_DIR
     # 런타임 캐시 파일
     YTDLP_VERSION_CHECK = CACHE_DIR / '.ytdlp_version_check'
+    # 요약/자막 교정 응답 캐시
+    RESPONSE_CACHE_PATH = CACHE_DIR / 'responses'
     
     # Whisper.cpp Configuration
     WHISPER_CPP_MODEL = os.getenv('WHISPER_CPP_MODEL', 
@@ -88,6 +90,7 @@ class Config:
     INCLUDE_TIMESTAMP = os.getenv('OPEN_SCRIBE_TIMESTAMP', 'false').lower() == 'true'
     COOKIES_BROWSER = os.getenv('OPEN_SCRIBE_COOKIES_BROWSER', '')
     ENABLE_NOTION = os.getenv('OPEN_SCRIBE_NOTION', 'false').lower() == 'true'
+    ENABLE_RESPONSE_CACHE = os.getenv('OPEN_SCRIBE_RESPONSE_CACHE', 'true').lower() == 'true'
 
 
     # Debug Configuration
@@ -3,11 +3,77 @@ Database operations for Open-Scribe
 Handles SQLite database for tracking transcription jobs
 """
 
+import os
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
+# Fixed SQL for the hot paths. Keeping the text identical across calls lets
+# sqlite3's per-connection statement cache reuse the compiled statement.
+_SQL_JOB_BY_ID = 'SELECT * FROM transcription_jobs WHERE id = ?'
+
+_SQL_JOB_STATS = 'SELECT status, COUNT(*) FROM transcription_jobs GROUP BY status'
+
+# Completed jobs whose completion is older than ? minutes, oldest first
+_OLD_COMPLETED_FILTER = '''
+    WHERE status = 'completed'
+    AND completed_at IS NOT NULL
+    AND datetime(completed_at) < datetime('now', '-' || ? || ' minutes')
+    ORDER BY completed_at ASC
+'''
+
+# update_job_status: the 'completed' transition also records its outputs
+_SQL_SET_STATUS = 'UPDATE transcription_jobs SET status = ? WHERE id = ?'
+_SQL_SET_COMPLETED = '''
+    UPDATE transcription_jobs
+    SET status = ?, transcript_path = ?, summary = ?, completed_at = ?
+    WHERE id = ?
+'''
+
+_SQL_DELETE_JOB = 'DELETE FROM transcription_jobs WHERE id = ?'
+
+# update_job_field whitelist, mapped to its prebuilt UPDATE statement
+_UPDATE_FIELD_SQL = {
+    field: f'UPDATE transcription_jobs SET {field} = ?, updated_at = ? WHERE id = ?'
+    for field in (
+        'status', 'progress', 'started_at', 'completed_at',
+        'error_message', 'download_path', 'transcript_path',
+        'srt_path', 'translation_path', 'summary'
+    )
+}
+
+# Job columns that point at files on disk
+_FILE_COLUMNS = ('download_path', 'transcript_path', 'srt_path', 'translation_path')
+
+# Path columns of one job, read just before its row is deleted
+_SQL_JOB_FILES = f"SELECT {', '.join(_FILE_COLUMNS)} FROM transcription_jobs WHERE id = ?"
+
+# SQLite 3.35+ can return the deleted row's paths from the DELETE itself
+_HAS_DELETE_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_SQL_DELETE_JOB_RETURNING_FILES = (
+    f"DELETE FROM transcription_jobs WHERE id = ? RETURNING {', '.join(_FILE_COLUMNS)}"
+)
+
+# Upper bound on concurrent unlinks when deleting files for many jobs
+_UNLINK_WORKERS = 8
+
+
+def _remove_file(file_path: str):
+    """Remove a job file; a file that is already gone is not an error"""
+    # One syscall per file: let remove() report a missing file
+    # instead of checking exists() first
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Warning: Could not delete file {file_path}: {e}")
+
+
 class TranscriptionDatabase:
     """Manage transcription job database"""
     
@@ -19,67 +85,118 @@ class TranscriptionDatabase:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # One long-lived connection shared by every caller (JobQueue workers,
+        # the reaper and the cleanup thread); the lock serializes access
+        self._lock = threading.RLock()
+        self._conn = self._connect()
         self._init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection whose rows support both index and key access"""
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # WAL only needs a commit-time fsync of the log, not of every page
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        # ~20 MB page cache; worth keeping now that the connection persists
+        conn.execute('PRAGMA cache_size=-20000')
+        return conn
+    
+    @contextmanager
+    def _transaction(self):
+        """Hold the lock and yield the connection; commit on success, roll back on error"""
+        with self._lock:
+            with self._conn:
+                yield self._conn
+    
+    def close(self):
+        """Close the shared connection"""
+        with self._lock:
+            self._conn.close()
+    
     def _init_database(self):
         """Initialize database with required tables"""
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        # Create jobs table with detailed progress tracking
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS transcription_jobs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                video_id TEXT NOT NULL,
-                url TEXT NOT NULL,
-                title TEXT,
-                engine TEXT NOT NULL,
-                status TEXT NOT NULL,
-                download_completed BOOLEAN DEFAULT 0,
-                download_path TEXT,
-                transcription_completed BOOLEAN DEFAULT 0,
-                transcript_path TEXT,
-                summary_completed BOOLEAN DEFAULT 0,
-                summary TEXT,
-                srt_completed BOOLEAN DEFAULT 0,
-                srt_path TEXT,
-                translation_completed BOOLEAN DEFAULT 0,
-                translation_path TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                completed_at TIMESTAMP,
-                UNIQUE(video_id, engine)
-            )
-        ''')
-        
-        # Migrate existing database if needed
-        cursor.execute("PRAGMA table_info(transcription_jobs)")
-        columns = [col[1] for col in cursor.fetchall()]
-        
-        # Add new columns if they don't exist (for migration)
-        new_columns = [
-            ("download_completed", "BOOLEAN DEFAULT 0"),
-            ("download_path", "TEXT"),
-            ("transcription_completed", "BOOLEAN DEFAULT 0"),
-            ("summary_completed", "BOOLEAN DEFAULT 0"),
-            ("srt_completed", "BOOLEAN DEFAULT 0"),
-            ("srt_path", "TEXT"),
-            ("translation_completed", "BOOLEAN DEFAULT 0"),
-            ("translation_path", "TEXT"),
-            ("updated_at", "TIMESTAMP DEFAULT CURRENT_TIMESTAMP")
-        ]
-        
-        for col_name, col_type in new_columns:
-            if col_name not in columns:
-                try:
-                    cursor.execute(f"ALTER TABLE transcription_jobs ADD COLUMN {col_name} {col_type}")
-                except sqlite3.OperationalError:
-                    pass  # Column might already exist
-        
-        conn.commit()
-        conn.close()
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            
+            # WAL lets readers (status polling, the cleanup thread) run while a
+            # job is writing; the mode is persistent so it is set once here
+            cursor.execute('PRAGMA journal_mode=WAL')
+            
+            # Create jobs table with detailed progress tracking
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS transcription_jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    video_id TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    title TEXT,
+                    engine TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    download_completed BOOLEAN DEFAULT 0,
+                    download_path TEXT,
+                    transcription_completed BOOLEAN DEFAULT 0,
+                    transcript_path TEXT,
+                    summary_completed BOOLEAN DEFAULT 0,
+                    summary TEXT,
+                    srt_completed BOOLEAN DEFAULT 0,
+                    srt_path TEXT,
+                    translation_completed BOOLEAN DEFAULT 0,
+                    translation_path TEXT,
+                    progress INTEGER DEFAULT 0,
+                    started_at TIMESTAMP,
+                    error_message TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    completed_at TIMESTAMP,
+                    UNIQUE(video_id, engine)
+                )
+            ''')
+            
+            # Migrate existing database if needed
+            cursor.execute("PRAGMA table_info(transcription_jobs)")
+            columns = [col[1] for col in cursor.fetchall()]
+            
+            # Add new columns if they don't exist (for migration)
+            new_columns = [
+                ("download_completed", "BOOLEAN DEFAULT 0"),
+                ("download_path", "TEXT"),
+                ("transcription_completed", "BOOLEAN DEFAULT 0"),
+                ("summary_completed", "BOOLEAN DEFAULT 0"),
+                ("srt_completed", "BOOLEAN DEFAULT 0"),
+                ("srt_path", "TEXT"),
+                ("translation_completed", "BOOLEAN DEFAULT 0"),
+                ("translation_path", "TEXT"),
+                ("updated_at", "TIMESTAMP DEFAULT CURRENT_TIMESTAMP"),
+                # Written by the background job queue (update_job_field / bulk_update_progress)
+                ("progress", "INTEGER DEFAULT 0"),
+                ("started_at", "TIMESTAMP"),
+                ("error_message", "TEXT")
+            ]
+            
+            for col_name, col_type in new_columns:
+                if col_name not in columns:
+                    try:
+                        cursor.execute(f"ALTER TABLE transcription_jobs ADD COLUMN {col_name} {col_type}")
+                    except sqlite3.OperationalError:
+                        pass  # Column might already exist
+            
+            # Composite index for status-filtered, created_at-ordered queries
+            # (get_pending_jobs): status lookups become index seeks instead of
+            # full table scans, and single-status queries come back pre-sorted
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_jobs_status_created
+                ON transcription_jobs(status, created_at)
+            ''')
+            
+            # Same shape for the auto-cleanup scan (get_old_completed_jobs):
+            # seeks straight to status = 'completed' and walks it in
+            # completed_at order, so the sort and the full scan both go away
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_jobs_status_completed
+                ON transcription_jobs(status, completed_at)
+            ''')
     
     def create_job(self, video_id: str, url: str, title: str, engine: str) -> int:
         """
@@ -94,18 +211,16 @@ class TranscriptionDatabase:
         Returns:
             int: Job ID
         """
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO transcription_jobs 
-            (video_id, url, title, engine, status, created_at)
-            VALUES (?, ?, ?, ?, 'processing', ?)
-        ''', (video_id, url, title, engine, datetime.now()))
-        
-        job_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                INSERT OR REPLACE INTO transcription_jobs 
+                (video_id, url, title, engine, status, created_at)
+                VALUES (?, ?, ?, ?, 'processing', ?)
+            ''', (video_id, url, title, engine, datetime.now()))
+            
+            job_id = cursor.lastrowid
         
         return job_id
     
@@ -121,24 +236,14 @@ class TranscriptionDatabase:
             transcript_path: Path to transcript file
             summary: Generated summary text
         """
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        if status == 'completed':
-            cursor.execute('''
-                UPDATE transcription_jobs 
-                SET status = ?, transcript_path = ?, summary = ?, completed_at = ?
-                WHERE id = ?
-            ''', (status, transcript_path, summary, datetime.now(), job_id))
-        else:
-            cursor.execute('''
-                UPDATE transcription_jobs 
-                SET status = ?
-                WHERE id = ?
-            ''', (status, job_id))
-        
-        conn.commit()
-        conn.close()
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            
+            if status == 'completed':
+                cursor.execute(_SQL_SET_COMPLETED,
+                               (status, transcript_path, summary, datetime.now(), job_id))
+            else:
+                cursor.execute(_SQL_SET_STATUS, (status, job_id))
     
     def check_existing_job(self, video_id: str, engine: str) -> Optional[Dict[str, Any]]:
         """
@@ -151,17 +256,15 @@ class TranscriptionDatabase:
         Returns:
             dict: Job details if exists, None otherwise
         """
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT * FROM transcription_jobs 
-            WHERE video_id = ? AND engine = ? AND status = 'completed'
-        ''', (video_id, engine))
-        
-        row = cursor.fetchone()
-        conn.close()
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT * FROM transcription_jobs 
+                WHERE video_id = ? AND engine = ? AND status = 'completed'
+            ''', (video_id, engine))
+            
+            row = cursor.fetchone()
         
         if row:
             return dict(row)
@@ -174,19 +277,16 @@ class TranscriptionDatabase:
         Returns:
             dict: Statistics including total, completed, failed counts
         """
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT COUNT(*) FROM transcription_jobs')
-        total = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM transcription_jobs WHERE status = 'completed'")
-        completed = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM transcription_jobs WHERE status = 'failed'")
-        failed = cursor.fetchone()[0]
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            
+            # Single GROUP BY pass over the status index; totals are folded here
+            cursor.execute(_SQL_JOB_STATS)
+            counts = dict(cursor)
         
-        conn.close()
+        total = sum(counts.values())
+        completed = counts.get('completed', 0)
+        failed = counts.get('failed', 0)
         
         return {
             'total': total,
@@ -197,73 +297,58 @@ class TranscriptionDatabase:
     
     def update_download_status(self, job_id: int, completed: bool, path: Optional[str] = None):
         """Update download completion status"""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE transcription_jobs 
-            SET download_completed = ?, download_path = ?, updated_at = ?
-            WHERE id = ?
-        ''', (completed, path, datetime.now(), job_id))
-        
-        conn.commit()
-        conn.close()
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                UPDATE transcription_jobs 
+                SET download_completed = ?, download_path = ?, updated_at = ?
+                WHERE id = ?
+            ''', (completed, path, datetime.now(), job_id))
     
     def update_transcription_status(self, job_id: int, completed: bool, path: Optional[str] = None):
         """Update transcription completion status"""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE transcription_jobs 
-            SET transcription_completed = ?, transcript_path = ?, updated_at = ?
-            WHERE id = ?
-        ''', (completed, path, datetime.now(), job_id))
-        
-        conn.commit()
-        conn.close()
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                UPDATE transcription_jobs 
+                SET transcription_completed = ?, transcript_path = ?, updated_at = ?
+                WHERE id = ?
+            ''', (completed, path, datetime.now(), job_id))
     
     def update_summary_status(self, job_id: int, completed: bool, text: Optional[str] = None):
         """Update summary completion status"""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE transcription_jobs 
-            SET summary_completed = ?, summary = ?, updated_at = ?
-            WHERE id = ?
-        ''', (completed, text, datetime.now(), job_id))
-        
-        conn.commit()
-        conn.close()
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                UPDATE transcription_jobs 
+                SET summary_completed = ?, summary = ?, updated_at = ?
+                WHERE id = ?
+            ''', (completed, text, datetime.now(), job_id))
     
     def update_srt_status(self, job_id: int, completed: bool, path: Optional[str] = None):
         """Update SRT generation status"""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE transcription_jobs 
-            SET srt_completed = ?, srt_path = ?, updated_at = ?
-            WHERE id = ?
-        ''', (completed, path, datetime.now(), job_id))
-        
-        conn.commit()
-        conn.close()
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                UPDATE transcription_jobs 
+                SET srt_completed = ?, srt_path = ?, updated_at = ?
+                WHERE id = ?
+            ''', (completed, path, datetime.now(), job_id))
     
     def update_translation_status(self, job_id: int, completed: bool, path: Optional[str] = None):
         """Update translation completion status"""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE transcription_jobs 
-            SET translation_completed = ?, translation_path = ?, updated_at = ?
-            WHERE id = ?
-        ''', (completed, path, datetime.now(), job_id))
-        
-        conn.commit()
-        conn.close()
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                UPDATE transcription_jobs 
+                SET translation_completed = ?, translation_path = ?, updated_at = ?
+                WHERE id = ?
+            ''', (completed, path, datetime.now(), job_id))
     
     def get_job_progress(self, video_id: str, engine: str) -> Optional[Dict[str, Any]]:
         """
@@ -276,17 +361,15 @@ class TranscriptionDatabase:
         Returns:
             dict: Job progress details if exists, None otherwise
         """
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT * FROM transcription_jobs 
-            WHERE video_id = ? AND engine = ?
-        ''', (video_id, engine))
-        
-        row = cursor.fetchone()
-        conn.close()
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT * FROM transcription_jobs 
+                WHERE video_id = ? AND engine = ?
+            ''', (video_id, engine))
+            
+            row = cursor.fetchone()
         
         if row:
             return dict(row)
@@ -299,20 +382,18 @@ class TranscriptionDatabase:
         Returns:
             List of job dictionaries
         """
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT * FROM transcription_jobs 
-            WHERE status IN ('pending', 'running')
-            ORDER BY created_at ASC
-        ''')
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        return [dict(row) for row in rows]
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT * FROM transcription_jobs 
+                WHERE status IN ('pending', 'running')
+                ORDER BY created_at ASC
+            ''')
+            
+            # Build dicts straight from the cursor (inside the lock, since the
+            # connection is shared) instead of materializing a row list first
+            return [dict(row) for row in cursor]
     
     def update_job_field(self, job_id: int, field: str, value: Any):
         """
@@ -323,28 +404,32 @@ class TranscriptionDatabase:
             field: Field name to update
             value: New value for the field
         """
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
         # Validate field name to prevent SQL injection
-        allowed_fields = [
-            'status', 'progress', 'started_at', 'completed_at', 
-            'error_message', 'download_path', 'transcript_path',
-            'srt_path', 'translation_path', 'summary'
-        ]
-        
-        if field not in allowed_fields:
+        query = _UPDATE_FIELD_SQL.get(field)
+        if query is None:
             raise ValueError(f"Field '{field}' is not allowed for update")
         
-        query = f'''
-            UPDATE transcription_jobs 
-            SET {field} = ?, updated_at = ?
-            WHERE id = ?
-        '''
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(query, (value, datetime.now(), job_id))
+    
+    def bulk_update_progress(self, progress_by_job: Dict[int, int]):
+        """
+        Update the progress of several jobs in one transaction
         
-        cursor.execute(query, (value, datetime.now(), job_id))
-        conn.commit()
-        conn.close()
+        Args:
+            progress_by_job: Latest progress per job ID
+        """
+        if not progress_by_job:
+            return
+        
+        now = datetime.now()
+        with self._transaction() as conn:
+            conn.executemany(
+                _UPDATE_FIELD_SQL['progress'],
+                ((progress, now, job_id) for job_id, progress in progress_by_job.items())
+            )
     
     def get_job_by_id(self, job_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -356,14 +441,12 @@ class TranscriptionDatabase:
         Returns:
             Job dictionary if exists, None otherwise
         """
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM transcription_jobs WHERE id = ?', (job_id,))
-        
-        row = cursor.fetchone()
-        conn.close()
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(_SQL_JOB_BY_ID, (job_id,))
+            
+            row = cursor.fetchone()
         
         if row:
             return dict(row)
@@ -379,22 +462,56 @@ class TranscriptionDatabase:
         Returns:
             List of old completed job dictionaries
         """
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('SELECT * FROM transcription_jobs' + _OLD_COMPLETED_FILTER, (minutes,))
+            
+            return [dict(row) for row in cursor]
+    
+    def get_old_completed_job_ids(self, minutes: int) -> List[int]:
+        """
+        Get IDs of completed jobs older than specified minutes
         
-        cursor.execute('''
-            SELECT * FROM transcription_jobs 
-            WHERE status = 'completed' 
-            AND completed_at IS NOT NULL
-            AND datetime(completed_at) < datetime('now', '-' || ? || ' minutes')
-            ORDER BY completed_at ASC
-        ''', (minutes,))
+        Same selection as get_old_completed_jobs, but reads only the id,
+        which the (status, completed_at) index already holds, so no table
+        rows are fetched or turned into dicts.
         
-        rows = cursor.fetchall()
-        conn.close()
+        Args:
+            minutes: Minutes since completion
+            
+        Returns:
+            List of job IDs, oldest first
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute('SELECT id FROM transcription_jobs' + _OLD_COMPLETED_FILTER, (minutes,))
+            return [row[0] for row in cursor]
+    
+    def _delete_row(self, conn: sqlite3.Connection, job_id: int,
+                    with_files: bool) -> Tuple[bool, List[str]]:
+        """
+        Delete one job row, returning whether it existed and its file paths
         
-        return [dict(row) for row in rows]
+        With SQLite 3.35+ the paths come back from a single DELETE ...
+        RETURNING. Older versions read the path columns first on the same
+        connection; callers hold _transaction(), so the row cannot change
+        between the two statements.
+        """
+        if not with_files:
+            return conn.execute(_SQL_DELETE_JOB, (job_id,)).rowcount > 0, []
+        
+        if _HAS_DELETE_RETURNING:
+            # fetchall() steps the statement to completion before commit
+            rows = conn.execute(_SQL_DELETE_JOB_RETURNING_FILES, (job_id,)).fetchall()
+            if not rows:
+                return False, []
+            job = rows[0]
+        else:
+            job = conn.execute(_SQL_JOB_FILES, (job_id,)).fetchone()
+            if not conn.execute(_SQL_DELETE_JOB, (job_id,)).rowcount:
+                return False, []
+        
+        return True, [path for path in job if path] if job else []
     
     def delete_job(self, job_id: int, delete_files: bool = False) -> bool:
         """
@@ -407,37 +524,51 @@ class TranscriptionDatabase:
         Returns:
             True if deleted successfully
         """
-        import os
-        
-        # Get job details first if we need to delete files
-        job = None
-        if delete_files:
-            job = self.get_job_by_id(job_id)
-        
-        # Delete from database
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM transcription_jobs WHERE id = ?', (job_id,))
-        deleted = cursor.rowcount > 0
-        
-        conn.commit()
-        conn.close()
-        
-        # Delete associated files if requested
-        if deleted and delete_files and job:
-            files_to_delete = [
-                job.get('download_path'),
-                job.get('transcript_path'),
-                job.get('srt_path'),
-                job.get('translation_path')
-            ]
-            
-            for file_path in files_to_delete:
-                if file_path and os.path.exists(file_path):
-                    try:
-                        os.remove(file_path)
-                    except Exception as e:
-                        print(f"Warning: Could not delete file {file_path}: {e}")
+        # Commits on success, rolls back on error
+        with self._transaction() as conn:
+            deleted, file_paths = self._delete_row(conn, job_id, delete_files)
         
-        return deleted
\ No newline at end of file
+        # Delete associated files (unique paths only; columns may share a file)
+        for file_path in dict.fromkeys(file_paths):
+            _remove_file(file_path)
+        
+        return deleted
+    
+    def delete_jobs(self, job_ids: List[int], delete_files: bool = False) -> int:
+        """
+        Delete several jobs from the database
+        
+        All rows are deleted in one write transaction, so the write lock
+        is taken and the WAL committed once per batch. Files of all jobs
+        are collected and removed concurrently afterwards, so filesystem
+        latency overlaps instead of adding up per file.
+        
+        Args:
+            job_ids: Job IDs to delete
+            delete_files: Whether to delete associated files
+            
+        Returns:
+            Number of jobs deleted
+        """
+        deleted_count = 0
+        file_paths: Dict[str, None] = {}
+        
+        with self._transaction() as conn:
+            # Take the write lock up front rather than upgrading mid-batch
+            conn.execute('BEGIN IMMEDIATE')
+            if not delete_files:
+                cursor = conn.executemany(_SQL_DELETE_JOB, ((job_id,) for job_id in job_ids))
+                deleted_count = max(cursor.rowcount, 0)
+            else:
+                for job_id in job_ids:
+                    deleted, paths = self._delete_row(conn, job_id, True)
+                    deleted_count += deleted
+                    file_paths.update(dict.fromkeys(paths))
+        
+        if file_paths:
+            workers = min(_UNLINK_WORKERS, len(file_paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # _remove_file reports its own errors; just drain the results
+                list(executor.map(_remove_file, file_paths))
+        
+        return deleted_count
\ No newline at end of file
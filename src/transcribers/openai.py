@@ -12,7 +12,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from .base import BaseTranscriber
 from ..utils.audio import (
     compress_audio_if_needed, format_timestamp,
-    should_use_chunking, split_audio_into_chunks, cleanup_temp_chunks,
+    should_use_chunking, split_audio_into_chunks, cleanup_temp_chunks, probe_audio,
     get_audio_duration
 )
 from ..utils.progress import create_estimated_progress
@@ -224,7 +224,7 @@ class WhisperAPITranscriber(OpenAITranscriber):
             print(f"[{self.display_name}] Using hybrid mode for accurate timestamps...")
             from ..utils.subtitle_corrector import HybridTranscriber
             
-            hybrid = HybridTranscriber(self.config)
+            hybrid = HybridTranscriber(self.config, use_cache=kwargs.get('use_cache', True))
             result = hybrid.transcribe_hybrid(
                 audio_path,  # Should be YouTube URL for hybrid mode
                 gpt_engine=self.model_name,
@@ -252,8 +252,12 @@ class WhisperAPITranscriber(OpenAITranscriber):
         # Check if chunking is needed or forced for GPT-4o timestamps
         force_chunking = return_timestamps and self.model_name in ["gpt-4o-transcribe", "gpt-4o-mini-transcribe"] and not use_hybrid
         
-        if should_use_chunking(audio_path) or force_chunking:
-            if force_chunking and not should_use_chunking(audio_path):
+        # Stat and probe the file once for the chunking and compression checks
+        audio_info = probe_audio(audio_path)
+        needs_chunking = should_use_chunking(audio_info)
+        
+        if needs_chunking or force_chunking:
+            if force_chunking and not needs_chunking:
                 print(f"[{self.display_name}] Using chunking for timestamp support...")
             else:
                 print(f"[{self.display_name}] File is large, using chunking strategy...")
@@ -299,12 +303,13 @@ class WhisperAPITranscriber(OpenAITranscriber):
                 cleanup_temp_chunks(chunk_paths, keep_for_debug=keep_chunks)
         
         # For smaller files, transcribe directly
-        processed_path, was_compressed = compress_audio_if_needed(audio_path)
+        processed_path, was_compressed = compress_audio_if_needed(audio_info)
         
         # Show progress
         progress = None
         if not stream:
-            file_size_mb = os.path.getsize(processed_path) / (1024 * 1024)
+            file_size = os.path.getsize(processed_path) if was_compressed else audio_info.size_bytes
+            file_size_mb = file_size / (1024 * 1024)
             estimated_duration = max(10, min(60, file_size_mb * 3))
             progress = create_estimated_progress(f"[{self.display_name}] Transcribing", estimated_duration)
             progress.start()
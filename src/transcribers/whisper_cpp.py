@@ -2,12 +2,14 @@
 Whisper.cpp local transcriber
 """
 
+import errno
 import os
 import re
 import subprocess
 import tempfile
 import hashlib
 import time
+from collections import deque
 from pathlib import Path
 from typing import Optional, List
 
@@ -16,6 +18,56 @@ from ..utils.audio import split_audio_into_chunks, cleanup_temp_chunks, get_audi
 from ..utils.worker_pool import WorkerPool, ChunkResult
 
 
+# Minimum interval between progress bar redraws (seconds)
+_REDRAW_INTERVAL = 0.05
+# Number of trailing stdout lines kept for error reporting
+_MAX_OUTPUT_LINES = 200
+# Read size for subprocess output
+_READ_CHUNK_SIZE = 65536
+
+# Output extensions whisper.cpp may write next to the temp output base name
+_OUTPUT_EXTENSIONS = ('.txt', '.srt')
+
+# Per-line patterns, compiled once at import instead of looked up per call
+# Segment line "[HH:MM:SS.mmm --> HH:MM:SS.mmm]"; captures the end time only
+_SEGMENT_LINE_RE = re.compile(r'\[\d{2}:\d{2}:\d{2}\.\d{3} --> (\d{2}):(\d{2}):(\d{2})\.\d{3}\]')
+# SRT cue timing line; captures the start time without milliseconds
+_SRT_TIMING_RE = re.compile(r'(\d{2}:\d{2}:\d{2}),\d{3} --> \d{2}:\d{2}:\d{2},\d{3}')
+# Merged chunk line "[HH:MM:SS] text" or "[MM:SS] text"
+_CHUNK_LINE_RE = re.compile(r'^\[(\d{1,2}):(\d{2})(?::(\d{2}))?\]\s*(.*)$')
+
+
+def _iter_output_lines(fd: int):
+    """
+    Yield decoded output lines from a file descriptor
+    
+    Reads in large chunks and splits in Python, carrying the partial
+    last line over to the next read, so a burst of short lines costs
+    one read() and one decode instead of one per line.
+    
+    Args:
+        fd: File descriptor to read until EOF
+    """
+    tail = b''
+    while True:
+        try:
+            chunk = os.read(fd, _READ_CHUNK_SIZE)
+        except OSError as e:
+            # A pty master raises EIO once the child closes its end
+            if e.errno == errno.EIO:
+                break
+            raise
+        if not chunk:
+            break
+        *lines, tail = (tail + chunk).split(b'\n')
+        if lines:
+            for line in b'\n'.join(lines).decode('utf-8', errors='replace').split('\n'):
+                # pty output uses CRLF line endings
+                yield line.rstrip('\r') + '\n'
+    if tail:
+        yield tail.decode('utf-8', errors='replace')
+
+
 class WhisperCppTranscriber(BaseTranscriber):
     """Transcriber using local whisper.cpp"""
     
@@ -23,6 +75,8 @@ class WhisperCppTranscriber(BaseTranscriber):
         super().__init__(config)
         self.model_path = config.WHISPER_CPP_MODEL
         self.executable_path = config.WHISPER_CPP_EXECUTABLE
+        # Cached result of is_available(); probing spawns whisper-cli
+        self._available: Optional[bool] = None
     
     @property
     def name(self) -> str:
@@ -35,7 +89,13 @@ class WhisperCppTranscriber(BaseTranscriber):
         return False
         
     def is_available(self) -> bool:
-        """Check if whisper.cpp is available"""
+        """Check if whisper.cpp is available (probed once per instance)"""
+        if self._available is None:
+            self._available = self._probe_available()
+        return self._available
+    
+    def _probe_available(self) -> bool:
+        """Check model file and run the executable once"""
         if not self.model_path or not Path(self.model_path).exists():
             return False
             
@@ -43,8 +103,9 @@ class WhisperCppTranscriber(BaseTranscriber):
         try:
             result = subprocess.run(
                 [self.executable_path, '--help'],
-                capture_output=True,
-                text=True,
+                # Only the exit status matters; don't buffer the usage text
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=5
             )
             return result.returncode == 0
@@ -52,7 +113,8 @@ class WhisperCppTranscriber(BaseTranscriber):
             return False
     
     def transcribe(self, audio_file: str, stream: bool = False,
-                  return_timestamps: bool = False, use_parallel: bool = True) -> Optional[str]:
+                  return_timestamps: bool = False, use_parallel: bool = True,
+                  **kwargs) -> Optional[str]:
         """
         Transcribe using whisper.cpp
         
@@ -61,6 +123,7 @@ class WhisperCppTranscriber(BaseTranscriber):
             stream: Streaming mode (not supported for whisper.cpp)
             return_timestamps: Whether to include timestamps
             use_parallel: Use parallel processing for large files
+            **kwargs: Options for other engines (ignored)
             
         Returns:
             str: Transcription text or None if failed
@@ -85,6 +148,7 @@ class WhisperCppTranscriber(BaseTranscriber):
         
         # Create a temp symlink with a simple name if the file has special characters
         temp_audio_link = None
+        master_fd = None
         audio_to_use = audio_file
         output_extension = '.txt'  # Default extension
         
@@ -94,15 +158,18 @@ class WhisperCppTranscriber(BaseTranscriber):
                 # Create temp symlink with simple name
                 import hashlib
                 file_hash = hashlib.md5(audio_file.encode()).hexdigest()[:8]
-                ext = Path(audio_file).suffix
+                ext = os.path.splitext(audio_file)[1]
                 temp_audio_link = f"/tmp/whisper_temp_{file_hash}{ext}"
                 
-                # Remove existing symlink if present
-                if Path(temp_audio_link).exists():
-                    Path(temp_audio_link).unlink()
+                # Remove existing symlink if present (unlink directly: exists()
+                # follows the link and misses a dangling one)
+                try:
+                    os.unlink(temp_audio_link)
+                except FileNotFoundError:
+                    pass
                 
                 # Create symlink
-                Path(temp_audio_link).symlink_to(Path(audio_file).absolute())
+                os.symlink(os.path.abspath(audio_file), temp_audio_link)
                 audio_to_use = temp_audio_link
                 print(f"Using temporary file for whisper.cpp processing...")
             except Exception as e:
@@ -142,36 +209,70 @@ class WhisperCppTranscriber(BaseTranscriber):
             
             # Run whisper.cpp with real-time output
             # Separate stderr to suppress debug output
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,  # Separate stderr to avoid debug output
-                universal_newlines=False
-                # bufsize=1 removed - not supported in binary mode
-            )
+            # whisper-cli block-buffers stdout when it is a pipe, so progress
+            # lines would arrive in 4-8 KiB bursts. On POSIX give it a
+            # pseudo-terminal instead so it line-buffers like in a shell.
+            if os.name == 'posix':
+                import pty
+                master_fd, slave_fd = pty.openpty()
+                stdout_target = slave_fd
+            else:
+                stdout_target = subprocess.PIPE
+            
+            try:
+                process = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=stdout_target,
+                    stderr=subprocess.PIPE,  # Separate stderr to avoid debug output
+                    universal_newlines=False
+                    # bufsize=1 removed - not supported in binary mode
+                )
+            except Exception:
+                # Popen failed (missing binary, permission denied): close both pty
+                # ends here; clearing master_fd keeps the finally from closing it twice
+                if master_fd is not None:
+                    os.close(slave_fd)
+                    os.close(master_fd)
+                    master_fd = None
+                raise
+            
+            if master_fd is not None:
+                # The child holds its own copy of the slave end
+                os.close(slave_fd)
+                output_fd = master_fd
+            else:
+                output_fd = process.stdout.fileno()
             
             # Stream output in real-time with progress bar
-            output_lines = []
+            # Only the tail of the output is kept; it is used for error reporting
+            output_lines = deque(maxlen=_MAX_OUTPUT_LINES)
             last_timestamp = 0
-            start_time = time.time()
+            last_redraw = 0.0
+            
+            # Loop invariants, resolved once instead of on every output line
+            # (parallel chunks don't drive this bar, so skip the match there)
+            match_segment = None if use_parallel else _SEGMENT_LINE_RE.match
+            show_debug = self.config.DEBUG
+            duration_str = f"{int(duration)//60:02d}:{int(duration)%60:02d}"
             
             try:
-                for line in process.stdout:
-                    decoded_line = line.decode('utf-8', errors='replace')
+                for decoded_line in _iter_output_lines(output_fd):
                     output_lines.append(decoded_line)
                     
                     # Parse timestamp from output like "[HH:MM:SS.mmm --> HH:MM:SS.mmm]"
-                    timestamp_match = re.match(r'\[(\d{2}):(\d{2}):(\d{2})\.\d{3} --> (\d{2}):(\d{2}):(\d{2})\.\d{3}\]', decoded_line)
-                    if timestamp_match and not use_parallel:
+                    timestamp_match = match_segment(decoded_line) if match_segment else None
+                    if timestamp_match:
                         # Extract end timestamp in seconds (use the end time for progress)
-                        hours = int(timestamp_match.group(4))
-                        minutes = int(timestamp_match.group(5))
-                        seconds = int(timestamp_match.group(6))
+                        hours, minutes, seconds = map(int, timestamp_match.groups())
                         current_time = hours * 3600 + minutes * 60 + seconds
                         
                         # Update progress based on actual timestamp
-                        if current_time > last_timestamp:
+                        # Redraws are coalesced so bursts of output cost one terminal write
+                        now = time.monotonic()
+                        if current_time > last_timestamp and now - last_redraw >= _REDRAW_INTERVAL:
                             last_timestamp = current_time
+                            last_redraw = now
                             # Calculate progress based on audio duration
                             if duration > 0:
                                 progress_pct = min(99, int((current_time / duration) * 100))
@@ -179,11 +280,12 @@ class WhisperCppTranscriber(BaseTranscriber):
                                 filled = int(bar_length * progress_pct / 100)
                                 bar = '█' * filled + '░' * (bar_length - filled)
                                 # Show both timestamp and percentage
-                                time_str = f"{current_time//60:02d}:{current_time%60:02d}/{int(duration)//60:02d}:{int(duration)%60:02d}"
+                                time_str = f"{current_time//60:02d}:{current_time%60:02d}/{duration_str}"
                                 print(f"\r[Whisper.cpp] Transcribing: [{bar}] {progress_pct:3d}% ({time_str})", end='', flush=True)
                     
-                    # Debug output if verbose
-                    elif self.config.VERBOSE and any(char.isdigit() for char in decoded_line):
+                    # Raw output echo is a debugging aid; VERBOSE is on by default,
+                    # so gate it on DEBUG to avoid one print per output line
+                    elif show_debug and any(char.isdigit() for char in decoded_line):
                         print(f"\n[DEBUG] Whisper output: {decoded_line.strip()[:100]}")
                 
                 # Wait for process to complete
@@ -211,7 +313,7 @@ class WhisperCppTranscriber(BaseTranscriber):
             if result.returncode != 0:
                 print(f"\nError: whisper.cpp failed with code {result.returncode}")
                 if result_output:
-                    print(f"Error output: {result_output[:500]}")  # Show first 500 chars
+                    print(f"Error output: {result_output[-500:]}")  # Show last 500 chars (just before the failure)
                 return None
             
             # Read the output file with correct extension
@@ -241,7 +343,7 @@ class WhisperCppTranscriber(BaseTranscriber):
                             # lines[0] is the sequence number
                             # lines[1] is the timestamp
                             # lines[2:] is the text
-                            timestamp_match = re.match(r'(\d{2}:\d{2}:\d{2}),\d{3} --> \d{2}:\d{2}:\d{2},\d{3}', lines[1])
+                            timestamp_match = _SRT_TIMING_RE.match(lines[1])
                             if timestamp_match:
                                 timestamp = timestamp_match.group(1)
                                 # Remove leading zeros from hours if 00
@@ -264,20 +366,19 @@ class WhisperCppTranscriber(BaseTranscriber):
             print(f"Error running whisper.cpp: {e}")
             return None
         finally:
-            # Clean up temp files (check for both .txt and .srt extensions)
-            try:
-                for ext in ['.txt', '.srt']:
-                    temp_file = output_file[:-4] + ext
-                    if Path(temp_file).exists():
-                        Path(temp_file).unlink()
-            except:
-                pass
+            if master_fd is not None:
+                os.close(master_fd)
             
-            # Clean up temp symlink if created
-            if temp_audio_link and Path(temp_audio_link).exists():
+            # Clean up temp files (both .txt and .srt extensions) and the temp
+            # symlink if created; one unlink per file, missing ones are skipped
+            output_base = output_file[:-4]
+            temp_files = [output_base + ext for ext in _OUTPUT_EXTENSIONS]
+            if temp_audio_link:
+                temp_files.append(temp_audio_link)
+            for temp_file in temp_files:
                 try:
-                    Path(temp_audio_link).unlink()
-                except:
+                    os.unlink(temp_file)
+                except OSError:
                     pass
     
     def _transcribe_parallel(self, audio_file: str, return_timestamps: bool = False) -> Optional[str]:
@@ -372,7 +473,7 @@ class WhisperCppTranscriber(BaseTranscriber):
             lines = result.text.split('\n')
             for line in lines:
                 # Match timestamp pattern [HH:MM:SS] or [MM:SS]
-                match = re.match(r'^\[(\d{1,2}):(\d{2})(?::(\d{2}))?\]\s*(.*)$', line)
+                match = _CHUNK_LINE_RE.match(line)
                 if match:
                     # Parse timestamp
                     if match.group(3):  # HH:MM:SS format
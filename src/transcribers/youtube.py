@@ -3,7 +3,7 @@ YouTube Transcript API transcriber
 """
 
 import re
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
 
@@ -11,6 +11,11 @@ from .base import BaseTranscriber
 from ..utils.validators import extract_video_id
 
 
+_WHITESPACE_RUN = re.compile(r'\s+')
+_SENTENCE_END = re.compile(r'([.!?])\s*')
+_VIDEO_ID_RE = re.compile(r'([a-zA-Z0-9_-]{11})')
+
+
 class YouTubeTranscriptAPITranscriber(BaseTranscriber):
     """Transcriber using YouTube's official transcript API"""
     
@@ -49,6 +54,66 @@ class YouTubeTranscriptAPITranscriber(BaseTranscriber):
         Returns:
             str: Transcription text or None if failed
         """
+        if return_timestamps:
+            segments = self.transcribe_segments(audio_path)
+            if segments is None:
+                return None
+            return self.format_segments(segments)
+        
+        transcript_data = self._fetch_transcript(audio_path)
+        if transcript_data is None:
+            return None
+        
+        # Just concatenate text with proper spacing
+        texts = []
+        for entry in transcript_data:
+            text = entry.text.replace('\n', ' ').strip()
+            if text:
+                texts.append(text)
+        # Join with spaces, then clean up multiple spaces
+        result = ' '.join(texts)
+        result = _WHITESPACE_RUN.sub(' ', result)
+        # Add basic sentence breaks
+        result = _SENTENCE_END.sub(r'\1\n', result)
+        return result.strip()
+    
+    def transcribe_segments(self, audio_path: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get merged transcript segments without formatting them to text
+        
+        Args:
+            audio_path: YouTube URL or video ID
+            
+        Returns:
+            list: Segments with 'start', 'duration' and 'text', or None if failed
+        """
+        transcript_data = self._fetch_transcript(audio_path)
+        if transcript_data is None:
+            return None
+        
+        # Merge segments for better readability
+        segments = self._merge_segments_smart(transcript_data)
+        for seg in segments:
+            seg['text'] = seg['text'].replace('\n', ' ')
+        return segments
+    
+    def format_segments(self, segments: List[Dict[str, Any]]) -> str:
+        """Format segments as '[MM:SS] text' lines"""
+        return '\n'.join(
+            f"[{self._format_timestamp(seg['start'])}] {seg['text']}"
+            for seg in segments
+        )
+    
+    def _fetch_transcript(self, audio_path: str):
+        """
+        Fetch raw transcript entries, preferring manual over auto-generated
+        
+        Args:
+            audio_path: YouTube URL or video ID
+            
+        Returns:
+            Fetched transcript entries or None if failed
+        """
         # Extract video ID from the URL/path
         video_id = extract_video_id(audio_path)
         if not video_id:
@@ -56,7 +121,7 @@ class YouTubeTranscriptAPITranscriber(BaseTranscriber):
             import os
             filename = os.path.basename(audio_path)
             # Remove extension and try to extract ID
-            video_id_match = re.search(r'([a-zA-Z0-9_-]{11})', filename)
+            video_id_match = _VIDEO_ID_RE.search(filename)
             if video_id_match:
                 video_id = video_id_match.group(1)
             else:
@@ -118,33 +183,7 @@ class YouTubeTranscriptAPITranscriber(BaseTranscriber):
                 return None
             
             # Fetch the transcript
-            transcript_data = transcript.fetch()
-            
-            # Format the output
-            if return_timestamps:
-                # Merge segments for better readability
-                merged_segments = self._merge_segments_smart(transcript_data)
-                
-                # Format with timestamps
-                lines = []
-                for seg in merged_segments:
-                    timestamp = self._format_timestamp(seg['start'])
-                    text = seg['text'].replace('\n', ' ')
-                    lines.append(f"[{timestamp}] {text}")
-                return '\n'.join(lines)
-            else:
-                # Just concatenate text with proper spacing
-                texts = []
-                for entry in transcript_data:
-                    text = entry.text.replace('\n', ' ').strip()
-                    if text:
-                        texts.append(text)
-                # Join with spaces, then clean up multiple spaces
-                result = ' '.join(texts)
-                result = re.sub(r'\s+', ' ', result)
-                # Add basic sentence breaks
-                result = re.sub(r'([.!?])\s*', r'\1\n', result)
-                return result.strip()
+            return transcript.fetch()
                 
         except TranscriptsDisabled:
             print("Error: Transcripts are disabled for this video")
@@ -3,58 +3,112 @@ Audio processing utilities for Open-Scribe
 """
 
 import os
+import re
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Union
 
-def compress_audio_if_needed(audio_path: str, max_size_mb: float = 25) -> Tuple[str, bool]:
+# [HH:]MM:SS[.fff]; seconds keep their fraction so one float() parses them
+_TIMESTAMP_RE = re.compile(r'(?:(\d+):)?(\d+):(\d+(?:\.\d+)?)')
+
+# Bitrate range used when compressing audio for upload (kbps)
+_MIN_COMPRESS_KBPS = 24
+_MAX_COMPRESS_KBPS = 64
+
+# Fixed parts of the ffmpeg/ffprobe command lines
+_FFMPEG_OUTPUT_OPTS = ("-y", "-loglevel", "error")  # Overwrite, report errors only
+_FFMPEG_VERSION_CMD = ("ffmpeg", "-version")
+_FFPROBE_DURATION_CMD = (
+    "ffprobe", "-v", "error",
+    "-show_entries", "format=duration",
+    "-of", "default=noprint_wrappers=1:nokey=1",
+)
+_CHUNK_COPY_CODEC = ("-c", "copy")  # Fast copy without re-encoding
+_CHUNK_REENCODE_CODEC = ("-c:a", "libmp3lame", "-b:a", "128k")
+
+# Threads used to delete chunk files
+_UNLINK_WORKERS = 8
+
+@dataclass(frozen=True)
+class AudioInfo:
+    """Size and duration of an audio file, probed once and passed along"""
+    path: str
+    size_bytes: int
+    duration_s: float
+
+def compress_audio_if_needed(audio: Union[str, AudioInfo], max_size_mb: float = 25) -> Tuple[str, bool]:
     """
     Compress audio file if it exceeds max size
     
     Args:
-        audio_path: Path to audio file
+        audio: Path to audio file, or its AudioInfo from probe_audio
         max_size_mb: Maximum file size in MB (default 25MB for OpenAI)
     
     Returns:
         tuple: (path to processed file, True if compressed)
     """
-    file_size_mb = os.path.getsize(audio_path) / (1024 * 1024)
+    if isinstance(audio, AudioInfo):
+        audio_path, size = audio.path, audio.size_bytes
+    else:
+        # The duration is only needed when compressing, so don't probe yet
+        audio_path, size = audio, os.path.getsize(audio)
+    file_size_mb = size / (1024 * 1024)
     
     if file_size_mb <= max_size_mb:
         return audio_path, False
     
     print(f"[Audio] File size ({file_size_mb:.1f}MB) exceeds limit ({max_size_mb}MB). Compressing...")
     
-    # Create compressed version with lower bitrate
-    compressed_path = audio_path.replace('.mp3', '_compressed.mp3')
-    
-    # Use progressively lower bitrates
-    bitrates = ["64k", "48k", "32k", "24k"]
-    
-    for bitrate in bitrates:
-        compress_cmd = [
-            "ffmpeg", "-i", audio_path,
-            "-b:a", bitrate,      # Lower bitrate
-            "-ar", "16000",       # Lower sample rate
-            "-ac", "1",           # Mono
-            compressed_path,
-            "-y",                 # Overwrite
-            "-loglevel", "error"
-        ]
-        
-        result = subprocess.run(compress_cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"[Audio] Error compressing at {bitrate}: {result.stderr}")
-            continue
-            
-        compressed_size_mb = os.path.getsize(compressed_path) / (1024 * 1024)
-        print(f"[Audio] Compressed to {compressed_size_mb:.1f}MB using {bitrate} bitrate")
+    # Create compressed version with lower bitrate, next to the original.
+    # Derived from the file name only: replacing '.mp3' in the full path hit
+    # directory names too, and for non-mp3 inputs left the path unchanged so
+    # ffmpeg was asked to overwrite its own input. Always .mp3: the encoder
+    # is libmp3lame, and ffmpeg picks the container from the extension, so
+    # keeping e.g. .webm or .wav gave an invalid or mislabelled file
+    source = Path(audio_path)
+    compressed_path = str(source.with_name(f"{source.stem}_compressed.mp3"))
+    
+    # One encode at a bitrate derived from the duration, instead of retrying
+    # a ladder of bitrates that each decode the whole file again. CBR output
+    # size is predictable enough that a second attempt rarely paid off.
+    duration = audio.duration_s if isinstance(audio, AudioInfo) else get_audio_duration(audio_path)
+    if duration > 0:
+        # 5% headroom for container overhead and rate-control drift
+        target_kbps = max_size_mb * 8 * 1024 / duration * 0.95
+        kbps = int(min(_MAX_COMPRESS_KBPS, max(_MIN_COMPRESS_KBPS, target_kbps)))
+    else:
+        # Unknown duration: use the smallest bitrate to give the best chance of fitting
+        kbps = _MIN_COMPRESS_KBPS
+    bitrate = f"{kbps}k"
+    
+    compress_cmd = [
+        "ffmpeg", "-i", audio_path,
+        "-b:a", bitrate,      # Lower bitrate
+        "-ar", "16000",       # Lower sample rate
+        "-ac", "1",           # Mono
+        "-c:a", "libmp3lame",
+        compressed_path,
+        *_FFMPEG_OUTPUT_OPTS
+    ]
+    
+    # ffmpeg writes the file itself; only stderr is kept, for errors
+    result = subprocess.run(compress_cmd, stdin=subprocess.DEVNULL,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        print(f"[Audio] Error compressing at {bitrate}: {result.stderr.decode(errors='replace')}")
+        return audio_path, False
         
-        if compressed_size_mb <= max_size_mb:
-            return compressed_path, True
+    compressed_size_mb = os.path.getsize(compressed_path) / (1024 * 1024)
+    print(f"[Audio] Compressed to {compressed_size_mb:.1f}MB using {bitrate} bitrate")
+    
+    if compressed_size_mb <= max_size_mb:
+        return compressed_path, True
     
-    # If all attempts failed, return original
+    # Too long to fit even at the bitrate floor; the file needs chunking instead
     print(f"[Audio] Warning: Could not compress below {max_size_mb}MB limit")
     return audio_path, False
 
@@ -81,13 +135,13 @@ def convert_to_wav(input_path: str, output_path: Optional[str] = None,
         "-ac", str(channels),
         "-c:a", "pcm_s16le",  # 16-bit PCM
         str(output_path),
-        "-y",
-        "-loglevel", "error"
+        *_FFMPEG_OUTPUT_OPTS
     ]
     
-    result = subprocess.run(convert_cmd, capture_output=True, text=True)
+    result = subprocess.run(convert_cmd, stdin=subprocess.DEVNULL,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
     if result.returncode != 0:
-        print(f"[Audio] Error converting to WAV: {result.stderr}")
+        print(f"[Audio] Error converting to WAV: {result.stderr.decode(errors='replace')}")
         return None
     
     return str(output_path)
@@ -100,8 +154,9 @@ def check_ffmpeg() -> bool:
         bool: True if ffmpeg is available
     """
     try:
-        result = subprocess.run(["ffmpeg", "-version"], 
-                              capture_output=True, text=True)
+        # Only the exit status matters; don't buffer the version banner
+        result = subprocess.run(_FFMPEG_VERSION_CMD,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         return result.returncode == 0
     except FileNotFoundError:
         return False
@@ -116,9 +171,8 @@ def format_timestamp(seconds: float) -> str:
     Returns:
         str: Formatted timestamp string
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
     
     if hours > 0:
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
@@ -135,21 +189,27 @@ def timestamp_to_seconds(timestamp_str: str) -> float:
     Returns:
         float: Time in seconds
     """
-    parts = timestamp_str.split(':')
-    if len(parts) == 3:
-        hours, minutes, seconds = parts
-        seconds_parts = seconds.split('.')
-        secs = float(seconds_parts[0])
-        if len(seconds_parts) > 1:
-            secs += float('0.' + seconds_parts[1])
-        return int(hours) * 3600 + int(minutes) * 60 + secs
-    elif len(parts) == 2:
-        minutes, seconds = parts
-        seconds_parts = seconds.split('.')
-        secs = float(seconds_parts[0])
-        if len(seconds_parts) > 1:
-            secs += float('0.' + seconds_parts[1])
-        return int(minutes) * 60 + secs
+    match = _TIMESTAMP_RE.fullmatch(timestamp_str.strip())
+    if not match:
+        return 0
+    hours, minutes, seconds = match.groups()
+    return int(hours or 0) * 3600 + int(minutes) * 60 + float(seconds)
+
+@lru_cache(maxsize=128)
+def _probe_duration(audio_path: str, mtime_ns: int, size: int) -> float:
+    """
+    Run ffprobe for the duration of an audio file
+    
+    mtime_ns and size are only part of the cache key, so a file that is
+    rewritten in place is probed again.
+    """
+    try:
+        cmd = [*_FFPROBE_DURATION_CMD, audio_path]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode == 0:
+            return float(result.stdout.strip())
+    except Exception as e:
+        print(f"[Audio] Error getting duration: {e}")
     return 0
 
 def get_audio_duration(audio_path: str) -> float:
@@ -162,32 +222,40 @@ def get_audio_duration(audio_path: str) -> float:
     Returns:
         float: Duration in seconds, or 0 if failed
     """
+    return probe_audio(audio_path).duration_s
+
+def probe_audio(audio_path: str) -> AudioInfo:
+    """
+    Get size and duration of an audio file with one stat
+    
+    Args:
+        audio_path: Path to audio file
+        
+    Returns:
+        AudioInfo: Size in bytes and duration in seconds, both 0 if the file
+        cannot be read
+    """
     try:
-        cmd = [
-            "ffprobe", "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            audio_path
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode == 0:
-            return float(result.stdout.strip())
-    except Exception as e:
+        st = os.stat(audio_path)
+    except OSError as e:
         print(f"[Audio] Error getting duration: {e}")
-    return 0
+        return AudioInfo(audio_path, 0, 0)
+    duration = _probe_duration(os.path.abspath(audio_path), st.st_mtime_ns, st.st_size)
+    return AudioInfo(audio_path, st.st_size, duration)
 
-def should_use_chunking(audio_path: str, max_size_mb: float = 25) -> bool:
+def should_use_chunking(audio: Union[str, AudioInfo], max_size_mb: float = 25) -> bool:
     """
     Determine if chunking is needed for the audio file
     
     Args:
-        audio_path: Path to audio file
+        audio: Path to audio file, or its AudioInfo from probe_audio
         max_size_mb: Maximum file size in MB
         
     Returns:
         bool: True if chunking should be used
     """
-    file_size_mb = os.path.getsize(audio_path) / (1024 * 1024)
+    info = audio if isinstance(audio, AudioInfo) else probe_audio(audio)
+    file_size_mb = info.size_bytes / (1024 * 1024)
     
     # Try compression first
     if file_size_mb > max_size_mb:
@@ -198,12 +266,47 @@ def should_use_chunking(audio_path: str, max_size_mb: float = 25) -> bool:
             return True  # Even compression won't be enough
     
     # Also use chunking for very long audio (>30 minutes)
-    duration = get_audio_duration(audio_path)
-    if duration > 1800:  # 30 minutes
+    if info.duration_s > 1800:  # 30 minutes
         return True
     
     return False
 
+def _segment_audio(audio_path: str, temp_dir: str, chunk_duration_seconds: int,
+                   codec_args: Tuple[str, ...]) -> List[str]:
+    """
+    Split an audio file into chunks with one ffmpeg segment-muxer run
+    
+    Args:
+        audio_path: Path to audio file
+        temp_dir: Directory the chunks are written to
+        chunk_duration_seconds: Duration of each chunk in seconds
+        codec_args: ffmpeg codec options for the chunks
+        
+    Returns:
+        list: Paths to the chunks in order, empty if ffmpeg failed
+    """
+    cmd = [
+        "ffmpeg", "-i", audio_path,
+        *codec_args,
+        "-f", "segment",
+        "-segment_time", str(chunk_duration_seconds),
+        "-reset_timestamps", "1",
+        # ffmpeg reports the chunks it wrote on stdout, so stale chunk files
+        # already in temp_dir are never mistaken for this run's output
+        "-segment_list", "pipe:1",
+        "-segment_list_type", "flat",
+        os.path.join(temp_dir, "chunk_%03d.mp3"),
+        *_FFMPEG_OUTPUT_OPTS
+    ]
+    
+    result = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"[Audio] Error creating chunks: {result.stderr}")
+        return []
+    
+    return [os.path.join(temp_dir, os.path.basename(name))
+            for name in result.stdout.splitlines() if name]
+
 def split_audio_into_chunks(audio_path: str, chunk_duration_seconds: int = 600, use_project_temp: bool = True) -> List[str]:
     """
     Split audio file into chunks of specified duration
@@ -221,8 +324,6 @@ def split_audio_into_chunks(audio_path: str, chunk_duration_seconds: int = 600,
         print(f"[Audio] Could not determine duration, returning original file")
         return [audio_path]
     
-    chunk_paths = []
-    
     # Use project temp_audio directory for easier debugging
     if use_project_temp:
         from pathlib import Path
@@ -239,46 +340,14 @@ def split_audio_into_chunks(audio_path: str, chunk_duration_seconds: int = 600,
     
     print(f"[Audio] Splitting {duration:.1f}s audio into {num_chunks} chunks of {chunk_duration_seconds}s each")
     
-    for i in range(num_chunks):
-        start_time = i * chunk_duration_seconds
-        chunk_path = os.path.join(temp_dir, f"chunk_{i:03d}.mp3")
-        
-        cmd = [
-            "ffmpeg", "-i", audio_path,
-            "-ss", str(start_time),
-            "-t", str(chunk_duration_seconds),
-            "-c", "copy",  # Fast copy without re-encoding
-            chunk_path,
-            "-y",
-            "-loglevel", "error"
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            # Try with re-encoding if copy fails
-            # Rebuild command explicitly to avoid index errors
-            remaining = max(0, duration - start_time)
-            target_duration = min(chunk_duration_seconds, remaining)
-            reencode_cmd = [
-                "ffmpeg",
-                "-i", audio_path,
-                "-ss", str(start_time),
-                "-t", str(target_duration),
-                "-c:a", "libmp3lame",
-                "-b:a", "128k",
-                chunk_path,
-                "-y",
-                "-loglevel", "error",
-            ]
-            result = subprocess.run(reencode_cmd, capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                print(f"[Audio] Error creating chunk {i}: {result.stderr}")
-                continue
-        
-        if os.path.exists(chunk_path):
-            chunk_paths.append(chunk_path)
-            print(f"[Audio] Created chunk {i+1}/{num_chunks}: {os.path.basename(chunk_path)}")
+    # One ffmpeg process demuxes the input once and writes every chunk
+    chunk_paths = _segment_audio(audio_path, temp_dir, chunk_duration_seconds, _CHUNK_COPY_CODEC)
+    if not chunk_paths:
+        # Try with re-encoding if copy fails
+        chunk_paths = _segment_audio(audio_path, temp_dir, chunk_duration_seconds, _CHUNK_REENCODE_CODEC)
+    
+    for i, chunk_path in enumerate(chunk_paths):
+        print(f"[Audio] Created chunk {i+1}/{len(chunk_paths)}: {os.path.basename(chunk_path)}")
     
     if not chunk_paths:
         print(f"[Audio] Failed to create chunks, returning original file")
@@ -286,6 +355,13 @@ def split_audio_into_chunks(audio_path: str, chunk_duration_seconds: int = 600,
     
     return chunk_paths
 
+def _remove_quietly(path: str):
+    """Delete a file, ignoring errors"""
+    try:
+        os.remove(path)
+    except Exception:
+        pass
+
 def cleanup_temp_chunks(chunk_paths: List[str], keep_for_debug: bool = False):
     """
     Clean up temporary chunk files
@@ -300,12 +376,13 @@ def cleanup_temp_chunks(chunk_paths: List[str], keep_for_debug: bool = False):
             print(f"[Audio] Chunks location: {os.path.dirname(chunk_paths[0])}")
         return
     
-    for path in chunk_paths:
-        try:
-            if os.path.exists(path):
-                os.remove(path)
-        except Exception:
-            pass
+    # Unlinks are independent, so overlap them; a missing file is not an error
+    if len(chunk_paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(_UNLINK_WORKERS, len(chunk_paths))) as executor:
+            list(executor.map(_remove_quietly, chunk_paths))
+    else:
+        for path in chunk_paths:
+            _remove_quietly(path)
     
     # Also try to remove the temp directory (but not if it's temp_audio)
     if chunk_paths:
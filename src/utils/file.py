@@ -6,6 +6,15 @@ import re
 from pathlib import Path
 from typing import Optional
 
+# Runs of invalid characters, control characters, whitespace and underscores.
+# A run collapses to one underscore, or to nothing if it is only control
+# characters - the same result as replacing, stripping and collapsing in turn
+_UNSAFE_RUN_RE = re.compile(r'[<>:"/\\|?*\[\]()\x00-\x1f\x7f\s_]+')
+_CTRL_RE = re.compile(r'[\x00-\x1f\x7f]+')
+
+def _replace_unsafe_run(match: re.Match) -> str:
+    return '' if _CTRL_RE.fullmatch(match.group()) else '_'
+
 def sanitize_filename(filename: str) -> str:
     """
     Create a safe filename for the file system
@@ -16,12 +25,9 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         str: Sanitized filename safe for filesystem
     """
-    # Remove invalid characters
-    filename = re.sub(r'[<>:"/\\|?*\[\]()]', '_', filename)
-    # Remove control characters
-    filename = re.sub(r'[\x00-\x1f\x7f]', '', filename)
-    # Replace multiple spaces/underscores with single underscore
-    filename = re.sub(r'[\s_]+', '_', filename)
+    # Replace invalid characters, drop control characters and collapse
+    # spaces/underscores in one pass
+    filename = _UNSAFE_RUN_RE.sub(_replace_unsafe_run, filename)
     # Strip leading/trailing special characters
     filename = filename.strip('._- ')
     # Limit length
@@ -2,18 +2,155 @@
 
 import threading
 import queue
+import heapq
+import itertools
+import selectors
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, Callable
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 import subprocess
 import os
+import re
+import signal
+import sys
 
 from ..database import TranscriptionDatabase
 from ..config import Config
 
 
+# 프로젝트 경로 (import 시 한 번만 계산)
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+_MAIN_SCRIPT = str(_PROJECT_ROOT / 'main.py')
+_VENV_PYTHON = _PROJECT_ROOT / '.venv' / ('Scripts' if os.name == 'nt' else 'bin') / (
+    'python.exe' if os.name == 'nt' else 'python'
+)
+# 프로젝트 로컬 .venv가 있으면 우선 사용, 없으면 현재 인터프리터 사용
+_PYTHON = str(_VENV_PYTHON) if _VENV_PYTHON.exists() else sys.executable
+
+
+# 진행률 패턴들 (출력 줄마다 쓰이므로 미리 컴파일)
+_PROGRESS_PATTERNS = [
+    re.compile(r'(\d+)%'),  # 일반적인 퍼센트 표시
+    re.compile(r'Progress:\s*(\d+)'),  # Progress: 숫자
+    re.compile(r'\[(\d+)/(\d+)\]'),  # [현재/전체] 형식
+    re.compile(r'Chunk\s+(\d+)/(\d+)'),  # Chunk 진행률
+]
+
+# 진행률 큐를 DB에 일괄 반영하는 주기 (초)
+_PROGRESS_FLUSH_INTERVAL = 0.5
+
+# 자식 stdout 한 번에 읽을 크기
+_READ_SIZE = 64 * 1024
+
+
+def _parse_progress(line: str) -> Optional[float]:
+    """출력 한 줄에서 진행률(%) 추출, 없으면 None"""
+    for pattern in _PROGRESS_PATTERNS:
+        match = pattern.search(line)
+        if match:
+            if len(match.groups()) == 1:
+                # 퍼센트 직접 표시
+                return float(match.group(1))
+            # 현재/전체 계산
+            current = float(match.group(1))
+            total = float(match.group(2))
+            return (current / total) * 100 if total > 0 else 0
+    return None
+
+
+def _last_progress(text: str) -> Optional[float]:
+    """여러 줄 출력에서 가장 마지막 진행률 추출 (뒤에서부터 검사)"""
+    for line in reversed(text.splitlines()):
+        progress = _parse_progress(line)
+        if progress is not None:
+            return progress
+    return None
+
+
+# 자식 프로세스 종료 감지용 pidfd selector (Linux 전용)
+# 작업 수와 무관하게 reaper 스레드 하나가 모든 자식의 종료를 기다린다.
+# pidfd를 지원하지 않는 플랫폼에서는 프로세스별 대기 스레드로 대체한다.
+_PIDFD_SELECTOR = selectors.DefaultSelector() if hasattr(os, 'pidfd_open') else None
+_reaper_thread: Optional[threading.Thread] = None
+_reaper_lock = threading.Lock()
+
+
+def _reaper_loop():
+    """종료된 자식 프로세스를 수거하고 종료 콜백 실행"""
+    while True:
+        for key, _ in _PIDFD_SELECTOR.select(timeout=1):
+            process, on_exit = key.data
+            _PIDFD_SELECTOR.unregister(key.fd)
+            os.close(key.fd)
+            process.wait()
+            try:
+                on_exit(process.returncode)
+            except Exception as e:
+                print(f"[JobQueue] Exit callback error: {e}")
+
+
+def _signal_process_tree(process: subprocess.Popen, sig: int):
+    """
+    작업 프로세스와 그 자식(yt-dlp, ffmpeg, whisper-cli 등)에 시그널 전송
+    
+    Args:
+        process: start_new_session=True로 실행한 프로세스
+        sig: 보낼 시그널 (POSIX 외에서는 SIGTERM/SIGKILL을 terminate/kill로 대체)
+    """
+    if os.name != 'posix':
+        if sig == signal.SIGTERM:
+            process.terminate()
+        else:
+            process.kill()
+        return
+    try:
+        # 자식은 자신의 세션 리더이므로 pgid == pid
+        os.killpg(process.pid, sig)
+    except ProcessLookupError:
+        pass
+
+
+def _watch_process_exit(process: subprocess.Popen, on_exit: Callable[[int], None]):
+    """
+    프로세스 종료 시 on_exit(returncode) 호출 예약
+    
+    Args:
+        process: 감시할 프로세스
+        on_exit: 종료 코드를 인자로 받는 콜백
+    """
+    global _reaper_thread
+    
+    pidfd = None
+    if _PIDFD_SELECTOR is not None:
+        try:
+            pidfd = os.pidfd_open(process.pid)
+        except OSError:
+            pidfd = None  # 커널 미지원 또는 이미 수거된 프로세스
+    
+    if pidfd is None:
+        # 기존 방식: 프로세스별 스레드에서 대기
+        def wait_and_notify():
+            process.wait()
+            on_exit(process.returncode)
+        
+        threading.Thread(target=wait_and_notify, daemon=True).start()
+        return
+    
+    with _reaper_lock:
+        if _reaper_thread is None:
+            _reaper_thread = threading.Thread(
+                target=_reaper_loop,
+                name="JobReaper",
+                daemon=True
+            )
+            _reaper_thread.start()
+    
+    _PIDFD_SELECTOR.register(pidfd, selectors.EVENT_READ, (process, on_exit))
+
+
 @dataclass
 class TranscriptionJob:
     """전사 작업 정보"""
@@ -51,12 +188,25 @@ class JobQueue:
         self._initialized = True
         config = Config()
         self.db = TranscriptionDatabase(config.DB_PATH)
-        self.job_queue = queue.PriorityQueue()
-        self.active_jobs: Dict[int, TranscriptionJob] = {}
+        # 대기 작업 힙 (-우선순위, 순번, 작업) - status_lock으로 보호,
+        # _job_available 세마포어 값 = 힙에 든 항목 수
+        self._job_heap: list = []
+        self._job_available = threading.Semaphore(0)
+        self._job_counter = itertools.count()  # 같은 우선순위는 들어온 순서대로
+        self.active_jobs: Dict[int, TranscriptionJob] = {}  # status_lock으로 보호
         self.worker_threads: list = []
         self.max_concurrent_jobs = 3  # 동시 실행 작업 수
         self.shutdown_flag = threading.Event()
         self.status_lock = threading.Lock()
+        # 실행 중인 프로세스 (job_id -> Popen), _active_lock으로 보호
+        self._active_processes: Dict[int, subprocess.Popen] = {}
+        self._cancelled_jobs: set = set()
+        self._active_lock = threading.Lock()
+        # 작업별 진행률 (job_id, progress) - 플러시 스레드가 모아서 한 번에 기록
+        self._progress_queue: queue.Queue = queue.Queue()
+        self.progress_thread = None
+        # 종료된 작업의 결과 기록(DB 쓰기) 전용 - reaper 스레드는 종료 코드 수거만 한다
+        self._finish_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="JobFinish")
         
         # 자동 정리 설정
         self.auto_cleanup_enabled = True
@@ -66,6 +216,9 @@ class JobQueue:
         # 워커 스레드 시작
         self._start_workers()
         
+        # 진행률 플러시 스레드 시작
+        self._start_progress_flusher()
+        
         # 기존 pending 작업들 큐에 복원
         self._restore_pending_jobs()
         
@@ -83,6 +236,38 @@ class JobQueue:
             worker.start()
             self.worker_threads.append(worker)
     
+    def _start_progress_flusher(self):
+        """진행률 플러시 스레드 시작"""
+        def flush_loop():
+            """모든 작업의 진행률을 주기마다 한 트랜잭션으로 기록"""
+            while not self.shutdown_flag.wait(_PROGRESS_FLUSH_INTERVAL):
+                self._flush_progress()
+            # 종료 전 남은 진행률 기록
+            self._flush_progress()
+        
+        self.progress_thread = threading.Thread(
+            target=flush_loop,
+            name="JobProgressFlusher",
+            daemon=True
+        )
+        self.progress_thread.start()
+    
+    def _flush_progress(self):
+        """큐에 쌓인 진행률을 작업별 최신 값으로 합쳐 DB에 기록"""
+        latest: Dict[int, int] = {}
+        while True:
+            try:
+                job_id, progress = self._progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            latest[job_id] = progress
+        
+        if latest:
+            try:
+                self.db.bulk_update_progress(latest)
+            except Exception as e:
+                print(f"[JobQueue] Progress flush error: {e}")
+    
     def _restore_pending_jobs(self):
         """DB에서 pending 상태 작업들 복원"""
         try:
@@ -104,7 +289,7 @@ class JobQueue:
                     self.db.update_job_status(job.job_id, 'pending')
                 
                 # 큐에 추가
-                self.job_queue.put((-job.priority, job.created_at, job))
+                self._enqueue(-job.priority, job)
                 
             if pending_jobs:
                 print(f"[JobQueue] Restored {len(pending_jobs)} pending jobs")
@@ -151,35 +336,41 @@ class JobQueue:
         )
         
         # 우선순위 큐에 추가 (음수로 변환하여 높은 값이 먼저 처리되도록)
-        self.job_queue.put((-priority, job.created_at, job))
+        self._enqueue(-priority, job)
         
         print(f"[JobQueue] Added job #{job_id}: {title[:50]}")
         return job_id
     
+    def _enqueue(self, priority: float, job: Optional[TranscriptionJob]):
+        """힙에 작업 추가 후 대기 중인 워커 하나를 깨움"""
+        with self.status_lock:
+            heapq.heappush(self._job_heap, (priority, next(self._job_counter), job))
+        self._job_available.release()
+    
+    def _dequeue(self) -> Optional[TranscriptionJob]:
+        """작업이 들어올 때까지 대기 후 우선순위가 가장 높은 작업 반환"""
+        self._job_available.acquire()
+        with self.status_lock:
+            return heapq.heappop(self._job_heap)[2]
+    
     def _worker_loop(self):
         """워커 스레드 메인 루프"""
-        while not self.shutdown_flag.is_set():
+        while True:
             try:
-                # 큐에서 작업 가져오기 (1초 타임아웃)
-                priority, created_at, job = self.job_queue.get(timeout=1.0)
+                # 큐에서 작업 가져오기 (작업이 들어올 때까지 대기)
+                job = self._dequeue()
+                
+                # 종료 신호
+                if job is None:
+                    break
                 
                 # 활성 작업 등록
                 with self.status_lock:
                     self.active_jobs[job.job_id] = job
                 
-                # 작업 실행
+                # 작업 실행 (종료 처리와 활성 작업 해제는 _finish_job에서 수행)
                 self._execute_job(job)
                 
-                # 활성 작업에서 제거
-                with self.status_lock:
-                    if job.job_id in self.active_jobs:
-                        del self.active_jobs[job.job_id]
-                
-                # 큐 작업 완료 표시
-                self.job_queue.task_done()
-                
-            except queue.Empty:
-                continue
             except Exception as e:
                 print(f"[JobQueue] Worker error: {e}")
     
@@ -199,7 +390,7 @@ class JobQueue:
         try:
             # main.py를 subprocess로 실행
             cmd = [
-                'python', 'main.py',
+                _PYTHON, _MAIN_SCRIPT,
                 job.url,
                 '--engine', job.engine
             ]
@@ -219,31 +410,85 @@ class JobQueue:
                 cmd.append('--srt')
             
             # 환경 변수 설정
+            # (API 키, OPEN_SCRIBE_* 설정을 자식이 읽으므로 전체 환경을 그대로 전달)
             env = os.environ.copy()
             env['PYTHONUNBUFFERED'] = '1'  # 실시간 출력
             
             # 프로세스 실행
+            # 새 세션으로 분리: 취소 시 프로세스 그룹 전체(다운로드/변환 자식 포함)를
+            # 한 번에 종료할 수 있고, 터미널 Ctrl+C가 작업에 직접 전달되지 않는다
             process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
                 env=env,
-                bufsize=1,
-                universal_newlines=True
+                start_new_session=True
             )
+            with self._active_lock:
+                self._active_processes[job.job_id] = process
             
-            # 진행률 모니터링
+            # stderr는 별도 스레드로 계속 비워서, 자식이 stderr 파이프가 가득 차
+            # 멈추는 일 없이 stdout 모니터링이 EOF까지 진행되게 한다
+            stderr_chunks: list = []
+            stderr_reader = threading.Thread(
+                target=lambda: stderr_chunks.append(process.stderr.read()),
+                name=f"JobStderr-{job.job_id}",
+                daemon=True
+            )
+            stderr_reader.start()
+            
+            # 진행률 모니터링 (stdout EOF까지)
             self._monitor_process(process, job)
             
-            # 프로세스 완료 대기
-            stdout, stderr = process.communicate()
+            # stderr도 이 워커에서 끝까지 읽어 둔다 (공유 reaper 스레드를 막지 않도록)
+            stderr_reader.join()
+            stderr = b''.join(stderr_chunks).decode('utf-8', errors='replace')
             
-            if process.returncode == 0:
+            # 프로세스 완료 대기는 reaper에 위임하고 워커는 다음 작업으로 넘어간다
+            # (결과 기록은 reaper가 아니라 별도 executor에서 실행)
+            _watch_process_exit(
+                process,
+                lambda returncode: self._schedule_finish(job, process, returncode, stderr)
+            )
+                
+        except Exception as e:
+            # 에러 처리
+            self.db.update_job_status(job.job_id, 'failed')
+            self.db.update_job_field(job.job_id, 'error_message', str(e))
+            print(f"[JobQueue] Error executing job #{job.job_id}: {e}")
+            self._release_job(job)
+    
+    def _schedule_finish(self, job: TranscriptionJob, process: subprocess.Popen,
+                         returncode: int, stderr: str):
+        """종료 콜백: 결과 기록을 executor에 넘기고, 종료 중이라 넘길 수 없으면 직접 기록"""
+        try:
+            self._finish_executor.submit(self._finish_job, job, process, returncode, stderr)
+        except RuntimeError:
+            # shutdown() 이후 executor는 새 작업을 받지 않는다.
+            # 그래도 결과는 남겨야 running 상태로 방치되지 않는다.
+            self._finish_job(job, process, returncode, stderr)
+    
+    def _finish_job(self, job: TranscriptionJob, process: subprocess.Popen,
+                    returncode: int, stderr: str):
+        """
+        종료된 작업의 결과 기록
+        
+        Args:
+            job: 작업 정보
+            process: 종료된 프로세스
+            returncode: 프로세스 종료 코드
+            stderr: 워커가 읽어 둔 자식의 stderr 출력
+        """
+        try:
+            if self._pop_cancelled(job.job_id):
+                # cancel_job에서 종료시킨 작업은 cancelled 상태 유지
+                print(f"[JobQueue] Cancelled job #{job.job_id}")
+            elif returncode == 0:
                 # 성공
                 self.db.update_job_status(job.job_id, 'completed')
                 self.db.update_job_field(job.job_id, 'completed_at', datetime.now().isoformat())
-                self.db.update_job_field(job.job_id, 'progress', 100)
+                # 진행률은 큐를 거쳐야 앞서 쌓인 값이 100을 덮어쓰지 않는다
+                self._progress_queue.put((job.job_id, 100))
                 print(f"[JobQueue] Completed job #{job.job_id}")
             else:
                 # 실패
@@ -251,12 +496,26 @@ class JobQueue:
                 self.db.update_job_status(job.job_id, 'failed')
                 self.db.update_job_field(job.job_id, 'error_message', error_msg)
                 print(f"[JobQueue] Failed job #{job.job_id}: {error_msg}")
-                
-        except Exception as e:
-            # 에러 처리
-            self.db.update_job_status(job.job_id, 'failed')
-            self.db.update_job_field(job.job_id, 'error_message', str(e))
-            print(f"[JobQueue] Error executing job #{job.job_id}: {e}")
+        finally:
+            for pipe in (process.stdout, process.stderr):
+                if pipe:
+                    pipe.close()
+            self._release_job(job)
+    
+    def _pop_cancelled(self, job_id: int) -> bool:
+        """취소 요청된 작업이면 표시를 지우고 True 반환"""
+        with self._active_lock:
+            if job_id in self._cancelled_jobs:
+                self._cancelled_jobs.discard(job_id)
+                return True
+        return False
+    
+    def _release_job(self, job: TranscriptionJob):
+        """활성 작업 목록에서 제거"""
+        with self._active_lock:
+            self._active_processes.pop(job.job_id, None)
+        with self.status_lock:
+            self.active_jobs.pop(job.job_id, None)
     
     def _monitor_process(self, process: subprocess.Popen, job: TranscriptionJob):
         """
@@ -266,42 +525,34 @@ class JobQueue:
             process: 실행 중인 프로세스
             job: 작업 정보
         """
-        import re
-        
-        # 진행률 패턴들
-        progress_patterns = [
-            r'(\d+)%',  # 일반적인 퍼센트 표시
-            r'Progress:\s*(\d+)',  # Progress: 숫자
-            r'\[(\d+)/(\d+)\]',  # [현재/전체] 형식
-            r'Chunk\s+(\d+)/(\d+)',  # Chunk 진행률
-        ]
-        
-        # stdout 실시간 읽기
-        for line in iter(process.stdout.readline, ''):
-            if not line:
-                break
-                
-            # 진행률 추출
-            for pattern in progress_patterns:
-                match = re.search(pattern, line)
-                if match:
-                    if len(match.groups()) == 1:
-                        # 퍼센트 직접 표시
-                        progress = float(match.group(1))
-                    elif len(match.groups()) == 2:
-                        # 현재/전체 계산
-                        current = float(match.group(1))
-                        total = float(match.group(2))
-                        if total > 0:
-                            progress = (current / total) * 100
-                        else:
-                            progress = 0
-                    else:
-                        continue
-                    
-                    # DB 업데이트 (너무 자주 하지 않도록)
-                    self.db.update_job_field(job.job_id, 'progress', min(progress, 99))
-                    break
+        # 마지막으로 기록한 진행률 (정수 %) - 같은 값이면 DB 쓰기 생략
+        last_progress = None
+        
+        # stdout을 큰 단위로 읽고, 읽은 묶음에서 가장 마지막 진행률만 사용한다
+        # (그 앞의 값들은 이미 지난 값이므로 정규식 검사도 생략)
+        fd = process.stdout.fileno()
+        tail = b''
+        eof = False
+        while not eof:
+            data = os.read(fd, _READ_SIZE)
+            if data:
+                data = tail + data
+                # 마지막 줄바꿈 뒤의 미완성 줄은 다음 읽기와 합쳐서 처리
+                cut = max(data.rfind(b'\n'), data.rfind(b'\r')) + 1
+                # 줄바꿈 없이 계속 쓰는 경우를 대비해 남겨둘 크기 제한
+                data, tail = data[:cut], data[cut:][-_READ_SIZE:]
+            else:
+                # EOF: 남은 미완성 줄까지 처리 후 종료
+                data, eof = tail, True
+            
+            progress = _last_progress(data.decode('utf-8', errors='replace'))
+            if progress is not None:
+                # DB 업데이트 (플러시 스레드가 모아서 기록, 너무 자주 하지 않도록)
+                # 정수 %가 바뀐 경우에만 기록: 같은 값의 반복 출력은 쓰기 없이 넘긴다
+                progress = min(int(progress), 99)
+                if progress != last_progress:
+                    self._progress_queue.put((job.job_id, progress))
+                    last_progress = progress
     
     def cancel_job(self, job_id: int) -> bool:
         """
@@ -313,18 +564,25 @@ class JobQueue:
         Returns:
             성공 여부
         """
-        with self.status_lock:
-            # 활성 작업인 경우
-            if job_id in self.active_jobs:
-                # TODO: 실행 중인 프로세스 종료
-                self.db.update_job_status(job_id, 'cancelled')
-                return True
-            
-            # 큐에서 제거 시도
-            # PriorityQueue는 직접 제거가 어려우므로
-            # 실행 시점에 cancelled 상태 확인으로 처리
-            self.db.update_job_status(job_id, 'cancelled')
-            return True
+        # 락 안에서는 프로세스 참조만 꺼내고, 종료 대기는 락 밖에서 수행
+        with self._active_lock:
+            process = self._active_processes.get(job_id)
+            if process is not None:
+                self._cancelled_jobs.add(job_id)
+        
+        self.db.update_job_status(job_id, 'cancelled')
+        
+        # 활성 작업인 경우 실행 중인 프로세스 그룹 종료
+        if process is not None and process.poll() is None:
+            _signal_process_tree(process, signal.SIGTERM)
+            try:
+                process.wait(timeout=5.0)
+            except subprocess.TimeoutExpired:
+                _signal_process_tree(process, signal.SIGKILL)
+        
+        # 큐에 남은 작업은 힙에서 직접 제거가 어려우므로
+        # 실행 시점에 cancelled 상태 확인으로 처리
+        return True
     
     def get_queue_status(self) -> Dict[str, Any]:
         """
@@ -334,11 +592,13 @@ class JobQueue:
             큐 상태 정보
         """
         with self.status_lock:
+            # 한 번만 복사해서 개수와 ID 목록이 서로 어긋나지 않게 한다
+            active_job_ids = list(self.active_jobs)
             return {
-                'queue_size': self.job_queue.qsize(),
-                'active_jobs': len(self.active_jobs),
+                'queue_size': len(self._job_heap),
+                'active_jobs': len(active_job_ids),
                 'max_concurrent': self.max_concurrent_jobs,
-                'active_job_ids': list(self.active_jobs.keys())
+                'active_job_ids': active_job_ids
             }
     
     def _start_cleanup_thread(self):
@@ -354,18 +614,15 @@ class JobQueue:
                         continue
                     
                     # 완료된 작업들 조회
-                    completed_jobs = self.db.get_old_completed_jobs(self.cleanup_after_minutes)
+                    # (삭제에는 ID만 필요하므로 전체 행 대신 ID만 조회)
+                    completed_job_ids = self.db.get_old_completed_job_ids(self.cleanup_after_minutes)
                     
-                    if completed_jobs:
-                        print(f"[JobQueue] Auto-cleaning {len(completed_jobs)} old completed jobs")
-                        for job in completed_jobs:
-                            try:
-                                # 파일도 함께 삭제
-                                self.db.delete_job(job['id'], delete_files=True)
-                            except Exception as e:
-                                print(f"[JobQueue] Error deleting job {job['id']}: {e}")
+                    if completed_job_ids:
+                        print(f"[JobQueue] Auto-cleaning {len(completed_job_ids)} old completed jobs")
+                        # 파일도 함께 삭제 (전체 작업의 파일을 모아 병렬 삭제)
+                        cleaned = self.db.delete_jobs(completed_job_ids, delete_files=True)
                         
-                        print(f"[JobQueue] Cleaned {len(completed_jobs)} old jobs")
+                        print(f"[JobQueue] Cleaned {cleaned} old jobs")
                         
                 except Exception as e:
                     print(f"[JobQueue] Cleanup thread error: {e}")
@@ -402,10 +659,23 @@ class JobQueue:
         print("[JobQueue] Shutting down...")
         self.shutdown_flag.set()
         
+        # 워커마다 종료 신호 전달 (대기 중인 작업보다 먼저 꺼내지도록 최우선 순위)
+        for _ in self.worker_threads:
+            self._enqueue(float('-inf'), None)
+        
         # 워커 스레드 종료 대기
         for worker in self.worker_threads:
             worker.join(timeout=5.0)
         
+        # 이미 제출된 결과 기록을 마친 뒤 executor 정리
+        # (완료 시 넣는 진행률 100이 플러시 스레드 종료 전에 큐에 들어가도록)
+        # 이후 종료되는 작업은 _schedule_finish가 직접 기록한다
+        self._finish_executor.shutdown(wait=True)
+        
+        # 진행률 플러시 스레드 종료 대기 (남은 진행률 기록)
+        if self.progress_thread:
+            self.progress_thread.join(timeout=2.0)
+        
         # 정리 스레드 종료 대기
         if self.cleanup_thread:
             self.cleanup_thread.join(timeout=2.0)
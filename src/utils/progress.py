@@ -2,11 +2,66 @@
 Progress display utilities for Open-Scribe
 """
 
+import os
 import sys
 import time
 import threading
 import itertools
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple, Union
+
+_SPINNER_CHARS = '⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏'
+
+# Return to column 0 and erase the line (ANSI EL2)
+_CLEAR_LINE = '\r\x1b[2K'
+
+
+def _bar_table(bar_length: int) -> Tuple[str, ...]:
+    """Every fill level of a bar_length-cell bar, indexed by filled cells"""
+    return tuple('█' * filled + '░' * (bar_length - filled) for filled in range(bar_length + 1))
+
+# A bar only has bar_length + 1 distinct renderings; build them once
+_BARS_30 = _bar_table(30)
+_BARS_40 = _bar_table(40)
+
+
+def progress_enabled() -> bool:
+    """
+    Whether progress bars should be drawn
+    
+    Animations are skipped when stdout is not a terminal (piped output,
+    bot workers, CI) or when OPEN_SCRIBE_PROGRESS=false.
+    
+    Returns:
+        bool: True if progress should be displayed
+    """
+    if os.getenv('OPEN_SCRIBE_PROGRESS', 'true').lower() != 'true':
+        return False
+    try:
+        return sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        # Replaced or closed stdout
+        return False
+
+class NullProgressBar:
+    """Progress bar that displays nothing, used when progress is disabled"""
+    
+    def start(self):
+        pass
+    
+    def stop(self):
+        pass
+    
+    def complete(self):
+        pass
+    
+    def finish(self):
+        pass
+    
+    def set_chunk_info(self, current: int, total: int):
+        pass
+    
+    def complete_chunk(self, chunk_number: int):
+        pass
 
 class ProgressBar:
     """Progress bar for non-streaming mode"""
@@ -24,11 +79,14 @@ class ProgressBar:
         
     def _animate(self):
         """Animation loop for progress bar"""
-        spinner = itertools.cycle(['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏'])
-        while not self.stop_event.is_set():
-            sys.stdout.write(f'\r{self.message} {next(spinner)} ')
+        # The message is fixed, so every frame can be built once up front
+        frames = itertools.cycle([f'\r{self.message} {char} ' for char in _SPINNER_CHARS])
+        # wait() returns as soon as stop() is called instead of finishing the frame sleep
+        while True:
+            sys.stdout.write(next(frames))
             sys.stdout.flush()
-            time.sleep(0.1)
+            if self.stop_event.wait(0.1):
+                break
         # Clear the line
         sys.stdout.write('\r' + ' ' * (len(self.message) + 3) + '\r')
         sys.stdout.flush()
@@ -57,15 +115,13 @@ class DownloadProgress:
     def display(self, prefix: str = "Downloading"):
         """Display progress bar"""
         bar_length = 30
-        filled = int(bar_length * self.percentage / 100)
-        bar = '█' * filled + '░' * (bar_length - filled)
+        filled = min(int(bar_length * self.percentage / 100), bar_length)
+        bar = _BARS_30[filled]
         
-        sys.stdout.write(f'\r{prefix}: [{bar}] {self.percentage:.1f}%')
+        # One write and flush per call, with the final newline appended
+        end = '\n' if self.percentage >= 100 else ''
+        sys.stdout.write(f'\r{prefix}: [{bar}] {self.percentage:.1f}%{end}')
         sys.stdout.flush()
-        
-        if self.percentage >= 100:
-            sys.stdout.write('\n')
-            sys.stdout.flush()
 
 class EstimatedProgressBar:
     """Progress bar with estimated time tracking"""
@@ -102,6 +158,7 @@ class EstimatedProgressBar:
     def _animate(self):
         """Animation loop for progress bar"""
         bar_length = 30
+        last_line = None
         
         while not self.stop_event.is_set():
             elapsed = time.time() - self.start_time
@@ -120,7 +177,7 @@ class EstimatedProgressBar:
             
             # Calculate bar fill
             filled = int(bar_length * progress / 100)
-            bar = '█' * filled + '░' * (bar_length - filled)
+            bar = _BARS_30[filled]
             
             # Format time display
             time_display = f"{int(elapsed)}s/{int(self.estimated_duration)}s"
@@ -134,16 +191,17 @@ class EstimatedProgressBar:
             else:
                 full_message = f'\r{self.message}: [{bar}] {progress:.1f}% ({time_display})'
             
-            # Display
-            sys.stdout.write(full_message + ' ' * 10)  # Extra spaces to clear line
-            sys.stdout.flush()
-            time.sleep(0.1)
+            # Display, unless the line reads the same as the last frame
+            if full_message != last_line:
+                last_line = full_message
+                sys.stdout.write(full_message + ' ' * 10)  # Extra spaces to clear line
+                sys.stdout.flush()
+            self.stop_event.wait(0.1)
         
         # Final update when completed
         if self.completed:
             elapsed = time.time() - self.start_time
-            filled = bar_length
-            bar = '█' * filled
+            bar = _BARS_30[bar_length]
             
             if self.current_chunk is not None and self.total_chunks is not None:
                 chunk_info = f" Chunk {self.current_chunk}/{self.total_chunks}:"
@@ -181,7 +239,7 @@ def show_spinner(message: str, duration: Optional[float] = None):
         message: Message to display
         duration: Duration in seconds (None for indefinite)
     """
-    progress = ProgressBar(message)
+    progress = ProgressBar(message) if progress_enabled() else NullProgressBar()
     progress.start()
     
     if duration:
@@ -193,7 +251,7 @@ def show_spinner(message: str, duration: Optional[float] = None):
 
 
 def create_estimated_progress(message: str, estimated_duration: float = 30.0,
-                            chunk_info: Optional[tuple] = None) -> EstimatedProgressBar:
+                            chunk_info: Optional[tuple] = None) -> Union[EstimatedProgressBar, NullProgressBar]:
     """
     Create an estimated progress bar
     
@@ -203,8 +261,11 @@ def create_estimated_progress(message: str, estimated_duration: float = 30.0,
         chunk_info: Optional tuple of (current_chunk, total_chunks)
         
     Returns:
-        EstimatedProgressBar instance
+        EstimatedProgressBar instance, or NullProgressBar if progress is disabled
     """
+    if not progress_enabled():
+        return NullProgressBar()
+    
     progress = EstimatedProgressBar(message, estimated_duration)
     if chunk_info:
         progress.set_chunk_info(chunk_info[0], chunk_info[1])
@@ -231,13 +292,17 @@ class ChunkedProgressBar:
         self.start_time = None
         self.stop_event = threading.Event()
         self.thread = None
-        self.lock = threading.Lock()  # Thread lock for safe updates
+        self.lock = threading.Lock()  # Guards completed_chunks increments
         self.active_workers = 0
         self.max_workers = 5
+        self.enabled = progress_enabled()
         
     def start(self):
         """Start the progress bar animation"""
         self.start_time = time.time()
+        if not self.enabled:
+            # Chunks are still counted, just not drawn
+            return
         self.thread = threading.Thread(target=self._animate)
         self.thread.daemon = True
         self.thread.start()
@@ -245,47 +310,55 @@ class ChunkedProgressBar:
     def _animate(self):
         """Animation loop for progress bar"""
         bar_length = 40  # Longer bar for better visibility
+        last_shown = None
         
         while not self.stop_event.is_set():
-            with self.lock:
-                elapsed = time.time() - self.start_time
+            # Read the counter once per frame without taking the lock: a
+            # frame-old count is fine for display, and workers calling
+            # complete_chunk never wait behind a terminal write
+            completed = self.completed_chunks
+            elapsed = time.time() - self.start_time
+            
+            # The line only changes when a chunk completes or, once the ETA
+            # is measured, when the elapsed second ticks over; skip the
+            # formatting and terminal write for ticks that would redraw
+            # the same text
+            shown = (completed, int(elapsed) if completed else None)
+            if shown != last_shown:
+                last_shown = shown
                 
                 # Calculate overall progress
-                progress_pct = (self.completed_chunks / self.total_chunks) * 100
+                progress_pct = (completed / self.total_chunks) * 100
                 
                 # Calculate ETA
-                if self.completed_chunks > 0:
-                    avg_time_per_chunk = elapsed / self.completed_chunks
-                    remaining_chunks = self.total_chunks - self.completed_chunks
+                if completed > 0:
+                    avg_time_per_chunk = elapsed / completed
+                    remaining_chunks = self.total_chunks - completed
                     eta = remaining_chunks * avg_time_per_chunk
                     eta_str = f"ETA: {int(eta)}s"
                 else:
                     eta_str = f"ETA: {int(self.estimated_total)}s"
                 
                 # Create progress bar
-                filled = int(bar_length * progress_pct / 100)
-                bar = '█' * filled + '░' * (bar_length - filled)
+                filled = min(int(bar_length * progress_pct / 100), bar_length)
+                bar = _BARS_40[filled]
                 
                 # Build status message
-                status = f"\r[{self.display_name}] Processing chunks: [{bar}] {self.completed_chunks}/{self.total_chunks} ({progress_pct:.1f}%) | {eta_str}"
+                status = f"[{self.display_name}] Processing chunks: [{bar}] {completed}/{self.total_chunks} ({progress_pct:.1f}%) | {eta_str}"
                 
-                # Clear line and write status
-                sys.stdout.write('\r' + ' ' * 100 + '\r')  # Clear entire line
-                sys.stdout.write(status)
+                # Clear line and write status in one write
+                sys.stdout.write(_CLEAR_LINE + status)
                 sys.stdout.flush()
             
-            time.sleep(0.1)
+            self.stop_event.wait(0.1)
         
         # Final update
-        with self.lock:
-            if self.completed_chunks == self.total_chunks:
-                elapsed = time.time() - self.start_time
-                filled = bar_length
-                bar = '█' * filled
-                status = f"\r[{self.display_name}] Processing chunks: [{bar}] {self.total_chunks}/{self.total_chunks} (100.0%) | Completed in {int(elapsed)}s"
-                sys.stdout.write('\r' + ' ' * 100 + '\r')  # Clear entire line
-                sys.stdout.write(status + '\n')
-                sys.stdout.flush()
+        if self.completed_chunks == self.total_chunks:
+            elapsed = time.time() - self.start_time
+            bar = _BARS_40[bar_length]
+            status = f"[{self.display_name}] Processing chunks: [{bar}] {self.total_chunks}/{self.total_chunks} (100.0%) | Completed in {int(elapsed)}s"
+            sys.stdout.write(_CLEAR_LINE + status + '\n')
+            sys.stdout.flush()
     
     def complete_chunk(self, chunk_number: int):
         """Mark a chunk as completed (thread-safe)"""
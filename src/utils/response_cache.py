@@ -0,0 +1,104 @@
+"""
+Cache for chat completion responses
+
+Summaries and subtitle corrections are deterministic enough to reuse when the
+exact same prompt is sent to the same model again (re-runs of a video, retries
+from the bot). Responses are kept in a small in-memory LRU backed by JSON files
+under the cache directory.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+
+class ResponseCache:
+    """In-memory LRU + on-disk cache keyed by a hash of the request"""
+
+    def __init__(self, cache_dir: Path, enabled: bool = True,
+                 max_entries: int = 256, memory_entries: int = 128):
+        """
+        Args:
+            cache_dir: Directory holding one JSON file per cached response
+            enabled: When False, get() always misses and put() is a no-op
+            max_entries: Maximum number of files kept on disk
+            memory_entries: Maximum number of responses kept in memory
+        """
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hash request parts (model, prompts, ...) into a cache key"""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on a miss"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+        try:
+            with open(self.cache_dir / f"{key}.json", 'r', encoding='utf-8') as f:
+                response = json.load(f)['response']
+        except (OSError, ValueError, KeyError):
+            return None
+
+        self._remember(key, response)
+        return response
+
+    def put(self, key: str, response: str):
+        """Store a response in memory and on disk"""
+        if not self.enabled:
+            return
+
+        self._remember(key, response)
+
+        path = self.cache_dir / f"{key}.json"
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'response': response}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+            self._prune()
+        except OSError:
+            # Disk cache is best effort; the in-memory copy still helps
+            pass
+
+    def _remember(self, key: str, response: str):
+        with self._lock:
+            self._memory[key] = response
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def _prune(self):
+        """Remove the oldest files once the disk cache exceeds max_entries"""
+        entries = list(os.scandir(self.cache_dir))
+        entries = [entry for entry in entries if entry.name.endswith('.json')]
+        if len(entries) <= self.max_entries:
+            return
+
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:len(entries) - self.max_entries]:
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                pass
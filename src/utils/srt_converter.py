@@ -5,7 +5,21 @@ Converts timestamped transcripts to SRT/VTT format
 
 import re
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Iterable, Iterator, List, NamedTuple, Tuple, Optional
+
+# [HH:MM:SS] or [MM:SS] followed by text (up to the next timestamp)
+_TIMESTAMP_PATTERN = re.compile(r'\[(\d{1,2}:\d{2}(?::\d{2})?)\]\s*([^\[]+)', re.DOTALL)
+# Any [HH:MM:SS] or [MM:SS] timestamp
+_HAS_TIMESTAMP = re.compile(r'\[\d{1,2}:\d{2}(?::\d{2})?\]')
+# Whitespace that ' '.join(text.split()) would change: leading, trailing,
+# repeated, or anything other than a plain space
+_UNNORMALIZED_SPACE = re.compile(r'^\s|\s$|\s\s|[^\S ]')
+
+
+class _Segment(NamedTuple):
+    """One timestamped piece of transcript"""
+    start_seconds: float
+    text: str
 
 
 class SRTConverter:
@@ -23,42 +37,76 @@ class SRTConverter:
         Returns:
             SRT formatted string
         """
+        return '\n\n'.join(SRTConverter._iter_srt_entries(timestamp_text, max_chars_per_line))
+    
+    @staticmethod
+    def _iter_srt_entries(timestamp_text: str, max_chars_per_line: int = 42,
+                          vtt: bool = False) -> Iterator[str]:
+        """
+        Yield SRT entries for timestamped text one at a time
+        
+        Args:
+            timestamp_text: Text with timestamps in [HH:MM:SS] or [MM:SS] format
+            max_chars_per_line: Maximum characters per subtitle line
+            vtt: Yield WebVTT cues instead (no index line, '.' before milliseconds)
+            
+        Yields:
+            SRT entries without the blank line that separates them
+        """
         # Parse timestamped segments
         segments = SRTConverter._parse_timestamped_text(timestamp_text)
         
-        if not segments:
-            return ""
-        
-        # Convert to SRT entries
-        srt_entries = []
-        
-        for i, segment in enumerate(segments):
+        for i, (start_seconds, text) in enumerate(segments):
             # Calculate end time (next segment start or current + duration estimate)
             if i < len(segments) - 1:
-                end_time = segments[i + 1]['start_seconds']
+                end_time = segments[i + 1].start_seconds
             else:
                 # Estimate duration based on text length (roughly 3 seconds per 50 chars)
-                text_length = len(segment['text'])
+                text_length = len(text)
                 estimated_duration = max(2.0, min(10.0, text_length / 15))  # 2-10 seconds
-                end_time = segment['start_seconds'] + estimated_duration
+                end_time = start_seconds + estimated_duration
             
             # Format subtitle lines (break long text)
             subtitle_lines = SRTConverter._format_subtitle_lines(
-                segment['text'], 
+                text, 
                 max_chars_per_line
             )
             
+            if vtt:
+                # VTT cue: no index line
+                start = SRTConverter._seconds_to_srt_timestamp(start_seconds, '.')
+                end = SRTConverter._seconds_to_srt_timestamp(end_time, '.')
+                yield f"{start} --> {end}\n{subtitle_lines}"
+                continue
+            
             # Create SRT entry
-            entry = SRTConverter._create_srt_entry(
+            yield SRTConverter._create_srt_entry(
                 index=i + 1,
-                start_seconds=segment['start_seconds'],
+                start_seconds=start_seconds,
                 end_seconds=end_time,
                 text=subtitle_lines
             )
-            
-            srt_entries.append(entry)
+    
+    @staticmethod
+    def _write_entries(entries: Iterable[str], output_file: Path, header: str = ''):
+        """
+        Write subtitle entries to a file as they are produced
+        
+        Entries are separated by a blank line, so the file matches the
+        joined string without that string ever being built.
         
-        return '\n\n'.join(srt_entries)
+        Args:
+            entries: Subtitle entries
+            output_file: File to write
+            header: Text written before the first entry
+        """
+        with output_file.open('w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(header)
+            separator = ''
+            for entry in entries:
+                f.write(separator)
+                f.write(entry)
+                separator = '\n\n'
     
     @staticmethod
     def timestamp_to_vtt(timestamp_text: str, max_chars_per_line: int = 42) -> str:
@@ -72,30 +120,13 @@ class SRTConverter:
         Returns:
             WebVTT formatted string
         """
-        # First convert to SRT format
-        srt_content = SRTConverter.timestamp_to_srt(timestamp_text, max_chars_per_line)
-        
-        if not srt_content:
-            return "WEBVTT\n\n"
-        
-        # Convert SRT to VTT
-        vtt_content = "WEBVTT\n\n"
-        
-        # Replace SRT timecode format with VTT format
-        # SRT: 00:00:00,000 --> 00:00:05,000
-        # VTT: 00:00:00.000 --> 00:00:05.000
-        for entry in srt_content.split('\n\n'):
-            lines = entry.split('\n')
-            if len(lines) >= 3:
-                # Skip index line (VTT doesn't use it)
-                timecode = lines[1].replace(',', '.')
-                text = '\n'.join(lines[2:])
-                vtt_content += f"{timecode}\n{text}\n\n"
-        
-        return vtt_content.strip()
+        # Entries are built in VTT form directly, no SRT round trip
+        return "WEBVTT\n\n" + '\n\n'.join(
+            SRTConverter._iter_srt_entries(timestamp_text, max_chars_per_line, vtt=True)
+        )
     
     @staticmethod
-    def _parse_timestamped_text(text: str) -> List[dict]:
+    def _parse_timestamped_text(text: str) -> List[_Segment]:
         """
         Parse text with timestamps into segments
         
@@ -107,11 +138,7 @@ class SRTConverter:
         """
         segments = []
         
-        # Pattern for [HH:MM:SS] or [MM:SS] followed by text
-        pattern = r'\[(\d{1,2}:\d{2}(?::\d{2})?)\]\s*([^\[]+)'
-        matches = re.findall(pattern, text, re.DOTALL)
-        
-        for timestamp_str, segment_text in matches:
+        for timestamp_str, segment_text in _TIMESTAMP_PATTERN.findall(text):
             # Convert timestamp to seconds
             seconds = SRTConverter._timestamp_str_to_seconds(timestamp_str)
             
@@ -119,11 +146,7 @@ class SRTConverter:
             clean_text = segment_text.strip()
             
             if clean_text:
-                segments.append({
-                    'timestamp': timestamp_str,
-                    'start_seconds': seconds,
-                    'text': clean_text
-                })
+                segments.append(_Segment(seconds, clean_text))
         
         return segments
     
@@ -144,14 +167,14 @@ class SRTConverter:
         return 0
     
     @staticmethod
-    def _seconds_to_srt_timestamp(seconds: float) -> str:
+    def _seconds_to_srt_timestamp(seconds: float, separator: str = ',') -> str:
         """Convert seconds to SRT timestamp format (HH:MM:SS,mmm)"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
+        # Whole milliseconds first, then integer divmods only
+        secs, millis = divmod(round(seconds * 1000), 1000)
+        minutes, secs = divmod(secs, 60)
+        hours, minutes = divmod(minutes, 60)
         
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
     
     @staticmethod
     def _format_subtitle_lines(text: str, max_chars: int) -> str:
@@ -165,6 +188,10 @@ class SRTConverter:
         Returns:
             Formatted text with line breaks
         """
+        # Most subtitles are short and already clean; return those as is
+        if len(text) <= max_chars and not _UNNORMALIZED_SPACE.search(text):
+            return text
+        
         # Remove existing line breaks and extra spaces
         text = ' '.join(text.split())
         
@@ -191,34 +218,56 @@ class SRTConverter:
                     lines.append(word[:max_chars])
                     current_line = [word[max_chars:]]
                     current_length = len(word[max_chars:])
+                
+                # A third line means the text gets rebalanced into two
+                # lines below; no point wrapping the rest
+                if len(lines) > 2:
+                    break
             else:
                 current_line.append(word)
                 current_length += word_length
-        
-        # Add remaining words
-        if current_line:
-            lines.append(' '.join(current_line))
+        else:
+            # Add remaining words
+            if current_line:
+                lines.append(' '.join(current_line))
         
         # Limit to 2 lines for readability
         if len(lines) > 2:
-            # Redistribute words across 2 lines
-            all_text = ' '.join(lines)
-            mid_point = len(all_text) // 2
-            
-            # Find the best split point near the middle
-            best_split = mid_point
-            for i in range(max(0, mid_point - 10), min(len(all_text), mid_point + 10)):
-                if i < len(all_text) and all_text[i] == ' ':
-                    best_split = i
-                    break
-            
-            lines = [
-                all_text[:best_split].strip(),
-                all_text[best_split:].strip()
-            ]
+            lines = SRTConverter._split_in_two(text, words)
         
         return '\n'.join(lines)
     
+    @staticmethod
+    def _split_in_two(text: str, words: List[str]) -> List[str]:
+        """
+        Split text into two lines of similar length at a word boundary
+        
+        Args:
+            text: Text with single spaces between words
+            words: The words of text
+            
+        Returns:
+            Two lines
+        """
+        if len(words) < 2:
+            # Nothing to split between; cut the single word in half
+            mid_point = len(text) // 2
+            return [text[:mid_point], text[mid_point:]]
+        
+        # Walk the words once and stop at the first one that ends past the
+        # middle; break before or after it, whichever is nearer the middle
+        mid_point = len(text) // 2
+        end = -1
+        for i, word in enumerate(words):
+            start = end + 1
+            end = start + len(word)
+            if end >= mid_point:
+                split = i + 1 if end - mid_point <= mid_point - start else i
+                split = min(max(split, 1), len(words) - 1)
+                break
+        
+        return [' '.join(words[:split]), ' '.join(words[split:])]
+    
     @staticmethod
     def _create_srt_entry(index: int, start_seconds: float, end_seconds: float, text: str) -> str:
         """
@@ -252,18 +301,14 @@ class SRTConverter:
             Path to saved file
         """
         # Convert based on format
+        # Write entries as they are built instead of joining them first
         if format == 'vtt':
-            content = SRTConverter.timestamp_to_vtt(timestamp_text)
-            extension = '.vtt'
+            output_file = output_path.with_suffix('.vtt')
+            entries = SRTConverter._iter_srt_entries(timestamp_text, vtt=True)
+            SRTConverter._write_entries(entries, output_file, header="WEBVTT\n\n")
         else:
-            content = SRTConverter.timestamp_to_srt(timestamp_text)
-            extension = '.srt'
-        
-        # Create output path with correct extension
-        output_file = output_path.with_suffix(extension)
-        
-        # Save file
-        output_file.write_text(content, encoding='utf-8')
+            output_file = output_path.with_suffix('.srt')
+            SRTConverter._write_entries(SRTConverter._iter_srt_entries(timestamp_text), output_file)
         
         return output_file
 
@@ -283,17 +328,14 @@ def convert_transcript_to_srt(input_file: Path, output_file: Optional[Path] = No
     transcript_text = input_file.read_text(encoding='utf-8')
     
     # Check if text has timestamps
-    if not re.search(r'\[\d{1,2}:\d{2}(?::\d{2})?\]', transcript_text):
+    if not _HAS_TIMESTAMP.search(transcript_text):
         raise ValueError("Input file does not contain timestamps in [MM:SS] or [HH:MM:SS] format")
     
     # Determine output path
     if output_file is None:
         output_file = input_file.with_suffix('.srt')
     
-    # Convert and save
-    converter = SRTConverter()
-    srt_content = converter.timestamp_to_srt(transcript_text)
-    
-    output_file.write_text(srt_content, encoding='utf-8')
+    # Convert and save, writing entries as they are built
+    SRTConverter._write_entries(SRTConverter._iter_srt_entries(transcript_text), output_file)
     
     return output_file
\ No newline at end of file
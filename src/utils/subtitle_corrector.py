@@ -3,21 +3,71 @@ Subtitle correction module using hybrid approach
 Combines YouTube transcript timecodes with GPT-4o transcription quality
 """
 
+import math
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 from openai import OpenAI
-from difflib import SequenceMatcher
 
 from ..config import Config
+from .response_cache import ResponseCache
+
+
+# Timestamped segment: [HH:MM:SS] or [MM:SS] followed by text up to the next bracket
+_TS_PATTERN = re.compile(r'\[(\d{1,2}:\d{2}(?::\d{2})?)\]\s*(.+?)(?=\[|\Z)', re.DOTALL)
+
+# YouTube segments sent per correction request, and attempts per block
+_CORRECTION_BLOCK_SEGMENTS = 40
+_CORRECTION_ATTEMPTS = 3
+
+# Seconds the YouTube fetch runs alone before the GPT transcription starts
+_YOUTUBE_HEAD_START = 3.0
+
+# Kept byte-identical across calls so the API can reuse the cached prompt prefix
+_CORRECTION_SYSTEM_PROMPT = """You are a subtitle correction specialist. Your task is to:
+1. Align high-quality transcription text with YouTube subtitle timestamps
+2. Preserve the exact timestamps from YouTube
+3. Use the superior text quality from GPT transcription
+4. Ensure proper sentence boundaries align with timestamps
+5. Maintain natural speech flow and readability
+
+Important rules:
+- Keep ALL timestamps from YouTube transcript
+- Replace YouTube text with GPT text where they match
+- Handle cases where GPT has better punctuation/capitalization
+- Preserve speaker changes and natural pauses
+"""
+
+
+@lru_cache(maxsize=8)
+def _correction_params(model: str) -> Dict:
+    """Completion parameters for model, without messages"""
+    if model.startswith('gpt-5'):
+        # gpt-5 models reject temperature and max_tokens
+        return {"model": model}
+    return {
+        "model": model,
+        "temperature": 0.1,  # Low temperature for consistency
+        "max_tokens": 4000,
+    }
 
 
 class SubtitleCorrector:
     """Hybrid subtitle correction using YouTube timecodes + GPT transcription"""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, use_cache: bool = True):
+        """
+        Args:
+            config: Configuration object
+            use_cache: Reuse cached corrections; when False fresh corrections
+                still replace the cached ones
+        """
         self.config = config
+        self.use_cache = use_cache
         self.client = OpenAI(api_key=config.OPENAI_API_KEY) if config.OPENAI_API_KEY else None
         self.correct_model = config.OPENAI_CORRECT_MODEL
+        self.cache = ResponseCache(config.RESPONSE_CACHE_PATH, enabled=config.ENABLE_RESPONSE_CACHE)
     
     def correct_with_youtube_timestamps(
         self, 
@@ -47,32 +97,140 @@ class SubtitleCorrector:
             print("[Subtitle Corrector] Warning: No timestamps found in YouTube transcript")
             return gpt_transcription
         
+        return self._correct_segments(youtube_segments, gpt_transcription, verbose)
+    
+    def correct_with_youtube_segments(
+        self,
+        segments: List[Dict[str, any]],
+        gpt_transcription: str,
+        verbose: bool = False
+    ) -> str:
+        """
+        Correct GPT transcription using already parsed YouTube segments
+        
+        Same as correct_with_youtube_timestamps, without formatting the
+        segments to text and parsing them back.
+        
+        Args:
+            segments: Segments with 'start' (seconds) and 'text', as returned by
+                YouTubeTranscriptAPITranscriber.transcribe_segments
+            gpt_transcription: High-quality transcription from GPT-4o
+            verbose: Show detailed processing info
+            
+        Returns:
+            Corrected transcript with accurate timestamps and high-quality text
+        """
+        timestamps = self._format_seconds_batch([seg['start'] for seg in segments])
+        youtube_segments = [
+            {
+                'timestamp': timestamp,
+                'time_seconds': self._timestamp_to_seconds(timestamp),
+                'text': seg['text'].strip()
+            }
+            for timestamp, seg in zip(timestamps, segments)
+        ]
+        
+        if not self.client:
+            print("[Subtitle Corrector] Error: OpenAI API key not configured")
+            return self._format_segments(youtube_segments)
+        
+        if not youtube_segments:
+            print("[Subtitle Corrector] Warning: No timestamps found in YouTube transcript")
+            return gpt_transcription
+        
+        return self._correct_segments(youtube_segments, gpt_transcription, verbose)
+    
+    def _correct_segments(
+        self,
+        youtube_segments: List[Dict[str, any]],
+        gpt_transcription: str,
+        verbose: bool = False
+    ) -> str:
+        """Correct parsed YouTube segments block by block and stitch the results"""
         if verbose:
             print(f"[Subtitle Corrector] Found {len(youtube_segments)} segments from YouTube")
             print(f"[Subtitle Corrector] Using {self.correct_model} for correction")
         
-        # Create correction prompt
-        system_prompt = """You are a subtitle correction specialist. Your task is to:
-1. Align high-quality transcription text with YouTube subtitle timestamps
-2. Preserve the exact timestamps from YouTube
-3. Use the superior text quality from GPT transcription
-4. Ensure proper sentence boundaries align with timestamps
-5. Maintain natural speech flow and readability
-
-Important rules:
-- Keep ALL timestamps from YouTube transcript
-- Replace YouTube text with GPT text where they match
-- Handle cases where GPT has better punctuation/capitalization
-- Preserve speaker changes and natural pauses
-"""
+        blocks = self._split_into_blocks(youtube_segments, gpt_transcription)
+        max_workers = min(self.config.MAX_WORKER, len(blocks))
+        max_workers = max(self.config.MIN_WORKER, max_workers)
+        
+        if verbose:
+            print(f"[Subtitle Corrector] Correcting {len(blocks)} blocks with {max_workers} workers")
+        
+        results = [None] * len(blocks)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._correct_block, segments, gpt_text, i, verbose): i
+                for i, (segments, gpt_text) in enumerate(blocks)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        corrected_text = '\n'.join(results)
+        
+        if verbose:
+            print(f"[Subtitle Corrector] Correction completed")
+            self._show_comparison(self._format_segments(youtube_segments), corrected_text)
+        
+        return corrected_text
+    
+    def _split_into_blocks(
+        self,
+        youtube_segments: List[Dict[str, any]],
+        gpt_transcription: str
+    ) -> List[Tuple[List[Dict[str, any]], str]]:
+        """
+        Split segments into fixed-size blocks paired with the matching GPT text
+        
+        GPT text has no timestamps, so each block receives the share of GPT words
+        proportional to the share of YouTube words its segments cover.
+        
+        Returns:
+            List of (segments, gpt_text) tuples in transcript order
+        """
+        gpt_words = gpt_transcription.split()
+        youtube_word_counts = [len(seg['text'].split()) for seg in youtube_segments]
+        total_youtube_words = max(1, sum(youtube_word_counts))
+        
+        blocks = []
+        covered_words = 0
+        gpt_index = 0
+        for start in range(0, len(youtube_segments), _CORRECTION_BLOCK_SEGMENTS):
+            end = start + _CORRECTION_BLOCK_SEGMENTS
+            covered_words += sum(youtube_word_counts[start:end])
+            if end >= len(youtube_segments):
+                gpt_end = len(gpt_words)
+            else:
+                gpt_end = round(len(gpt_words) * covered_words / total_youtube_words)
+            blocks.append((youtube_segments[start:end], ' '.join(gpt_words[gpt_index:gpt_end])))
+            gpt_index = gpt_end
+        
+        return blocks
+    
+    def _correct_block(
+        self,
+        segments: List[Dict[str, any]],
+        gpt_text: str,
+        block_index: int,
+        verbose: bool = False
+    ) -> str:
+        """
+        Correct one block, retrying until every YouTube timestamp is preserved
+        
+        Returns:
+            Corrected block text, or the original YouTube block on failure
+        """
+        youtube_block = self._format_segments(segments)
+        expected_times = [seg['time_seconds'] for seg in segments]
         
         user_prompt = f"""Please align these two transcripts:
 
 YOUTUBE TRANSCRIPT (with timestamps):
-{youtube_transcript}
+{youtube_block}
 
 HIGH-QUALITY TRANSCRIPTION (GPT-4o):
-{gpt_transcription}
+{gpt_text}
 
 Output the corrected subtitle with:
 - Exact timestamps from YouTube
@@ -81,29 +239,37 @@ Output the corrected subtitle with:
 
 Return ONLY the corrected subtitle text, no explanations."""
         
-        try:
-            response = self.client.chat.completions.create(
-                model=self.correct_model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.1,  # Low temperature for consistency
-                max_tokens=4000
-            )
-            
-            corrected_text = response.choices[0].message.content.strip()
-            
-            if verbose:
-                print(f"[Subtitle Corrector] Correction completed")
-                self._show_comparison(youtube_transcript, corrected_text)
-            
-            return corrected_text
+        cache_key = ResponseCache.make_key(self.correct_model, _CORRECTION_SYSTEM_PROMPT, user_prompt)
+        cached_text = self.cache.get(cache_key) if self.use_cache else None
+        if cached_text is not None:
+            return cached_text
+        
+        for attempt in range(1, _CORRECTION_ATTEMPTS + 1):
+            try:
+                response = self.client.chat.completions.create(
+                    **_correction_params(self.correct_model),
+                    messages=[
+                        {"role": "system", "content": _CORRECTION_SYSTEM_PROMPT},
+                        {"role": "user", "content": user_prompt}
+                    ]
+                )
+                
+                corrected_text = response.choices[0].message.content.strip()
+                corrected_times = [seg['time_seconds'] for seg in self._parse_timestamped_text(corrected_text)]
+                if corrected_times == expected_times:
+                    self.cache.put(cache_key, corrected_text)
+                    return corrected_text
+                
+                if verbose:
+                    print(f"[Subtitle Corrector] Block {block_index + 1}: timestamps changed "
+                          f"(attempt {attempt}/{_CORRECTION_ATTEMPTS})")
             
-        except Exception as e:
-            print(f"[Subtitle Corrector] Error during correction: {e}")
-            print("[Subtitle Corrector] Falling back to YouTube transcript")
-            return youtube_transcript
+            except Exception as e:
+                print(f"[Subtitle Corrector] Error correcting block {block_index + 1} "
+                      f"(attempt {attempt}/{_CORRECTION_ATTEMPTS}): {e}")
+        
+        print(f"[Subtitle Corrector] Falling back to YouTube transcript for block {block_index + 1}")
+        return youtube_block
     
     def align_timestamps_with_text(
         self,
@@ -132,13 +298,12 @@ Return ONLY the corrected subtitle text, no explanations."""
         # Calculate words per timestamp
         words_per_timestamp = max(1, total_words // total_timestamps)
         
-        result = []
+        formatted = self._format_seconds_batch([start_time for start_time, _ in timestamps])
+        
+        lines = []
         word_index = 0
         
-        for i, (start_time, _) in enumerate(timestamps):
-            # Format timestamp
-            timestamp = self._format_seconds_to_timestamp(start_time)
-            
+        for i, timestamp in enumerate(formatted):
             # Calculate how many words for this segment
             if i == total_timestamps - 1:
                 # Last segment gets all remaining words
@@ -149,10 +314,9 @@ Return ONLY the corrected subtitle text, no explanations."""
                 word_index = end_index
             
             if segment_words:
-                segment_text = ' '.join(segment_words)
-                result.append(f"[{timestamp}] {segment_text}")
+                lines.append("[%s] %s" % (timestamp, ' '.join(segment_words)))
         
-        return '\n'.join(result)
+        return '\n'.join(lines)
     
     def _parse_timestamped_text(self, text: str) -> List[Dict[str, any]]:
         """
@@ -166,11 +330,7 @@ Return ONLY the corrected subtitle text, no explanations."""
         """
         segments = []
         
-        # Pattern for timestamps [HH:MM:SS] or [MM:SS]
-        pattern = r'\[(\d{1,2}:\d{2}(?::\d{2})?)\]\s*(.+?)(?=\[|\Z)'
-        matches = re.findall(pattern, text, re.DOTALL)
-        
-        for timestamp_str, segment_text in matches:
+        for timestamp_str, segment_text in _TS_PATTERN.findall(text):
             segments.append({
                 'timestamp': timestamp_str,
                 'time_seconds': self._timestamp_to_seconds(timestamp_str),
@@ -179,6 +339,10 @@ Return ONLY the corrected subtitle text, no explanations."""
         
         return segments
     
+    def _format_segments(self, segments: List[Dict[str, any]]) -> str:
+        """Format parsed segments back to '[timestamp] text' lines"""
+        return '\n'.join(f"[{seg['timestamp']}] {seg['text']}" for seg in segments)
+    
     def _timestamp_to_seconds(self, timestamp: str) -> float:
         """Convert timestamp string to seconds"""
         parts = timestamp.split(':')
@@ -194,14 +358,20 @@ Return ONLY the corrected subtitle text, no explanations."""
     
     def _format_seconds_to_timestamp(self, seconds: float) -> str:
         """Format seconds to HH:MM:SS or MM:SS format"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        
-        if hours > 0:
-            return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-        else:
-            return f"{minutes:02d}:{secs:02d}"
+        return self._format_seconds_batch((seconds,))[0]
+    
+    def _format_seconds_batch(self, starts) -> List[str]:
+        """Format many second offsets to HH:MM:SS or MM:SS in one pass"""
+        formatted = []
+        append = formatted.append
+        for seconds in starts:
+            minutes, secs = divmod(math.floor(seconds), 60)
+            hours, minutes = divmod(minutes, 60)
+            if hours > 0:
+                append(f"{hours:02d}:{minutes:02d}:{secs:02d}")
+            else:
+                append(f"{minutes:02d}:{secs:02d}")
+        return formatted
     
     def _show_comparison(self, original: str, corrected: str):
         """Show comparison between original and corrected for debugging"""
@@ -221,9 +391,9 @@ class HybridTranscriber:
     Hybrid transcriber that combines YouTube timestamps with GPT-4o quality
     """
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, use_cache: bool = True):
         self.config = config
-        self.corrector = SubtitleCorrector(config)
+        self.corrector = SubtitleCorrector(config, use_cache=use_cache)
     
     def transcribe_hybrid(
         self,
@@ -240,53 +410,85 @@ class HybridTranscriber:
             verbose: Show detailed progress
             
         Returns:
-            Hybrid transcription with timestamps
+            Hybrid transcription with timestamps (the plain GPT transcription
+            if the YouTube fetch fails after GPT has started)
         """
         from ..transcribers.youtube import YouTubeTranscriptAPITranscriber
         from ..transcribers.openai import GPT4OTranscriber, GPT4OMiniTranscriber
         
-        # Step 1: Get YouTube transcript with timestamps
-        if verbose:
-            print("[Hybrid] Step 1: Fetching YouTube transcript with timestamps...")
-        
-        youtube_transcriber = YouTubeTranscriptAPITranscriber(self.config)
-        youtube_transcript = youtube_transcriber.transcribe(
-            url, 
-            return_timestamps=True
-        )
-        
-        if not youtube_transcript:
-            print("[Hybrid] Error: Could not fetch YouTube transcript")
-            return None
-        
-        # Step 2: Get high-quality transcription from GPT
-        if verbose:
-            print(f"[Hybrid] Step 2: Getting high-quality transcription from {gpt_engine}...")
-        
         # Select GPT transcriber
         if gpt_engine == "gpt-4o-transcribe":
             gpt_transcriber = GPT4OTranscriber(self.config)
         else:
             gpt_transcriber = GPT4OMiniTranscriber(self.config)
         
-        # For hybrid mode, we don't use GPT timestamps since YouTube has better ones
-        gpt_transcription = gpt_transcriber.transcribe(
-            url,
-            return_timestamps=False  # Don't use GPT timestamps
-        )
+        youtube_transcriber = YouTubeTranscriptAPITranscriber(self.config)
+        
+        # Steps 1 and 2 are independent and run concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Step 1: Get YouTube transcript with timestamps
+            if verbose:
+                print("[Hybrid] Step 1: Fetching YouTube transcript with timestamps...")
+            youtube_future = executor.submit(youtube_transcriber.transcribe_segments, url)
+            
+            # Give the (usually quick) YouTube fetch a head start: a video without
+            # captions should fail before we pay for a GPT transcription
+            wait([youtube_future], timeout=_YOUTUBE_HEAD_START)
+            if youtube_future.done():
+                youtube_segments, error = self._future_result(youtube_future)
+                if not youtube_segments:
+                    print(f"[Hybrid] Error: Could not fetch YouTube transcript{error}")
+                    return None
+            
+            # Step 2: Get high-quality transcription from GPT
+            if verbose:
+                print(f"[Hybrid] Step 2: Getting high-quality transcription from {gpt_engine}...")
+            
+            # For hybrid mode, we don't use GPT timestamps since YouTube has better ones
+            gpt_future = executor.submit(
+                gpt_transcriber.transcribe,
+                url,
+                return_timestamps=False  # Don't use GPT timestamps
+            )
+            
+            youtube_segments, error = self._future_result(youtube_future)
+            if not youtube_segments:
+                print(f"[Hybrid] Error: Could not fetch YouTube transcript{error}")
+                # The GPT transcription is already paid for: hand it back rather
+                # than letting the caller transcribe the same file a second time
+                gpt_transcription, error = self._future_result(gpt_future)
+                if gpt_transcription:
+                    print("[Hybrid] Warning: using GPT transcription without timestamps")
+                return gpt_transcription
+            if verbose:
+                print(f"[Hybrid] YouTube transcript ready ({len(youtube_segments)} segments)")
+            
+            gpt_transcription, error = self._future_result(gpt_future)
         
         if not gpt_transcription:
-            print("[Hybrid] Warning: GPT transcription failed, using YouTube transcript only")
-            return youtube_transcript
+            print(f"[Hybrid] Warning: GPT transcription failed{error}, using YouTube transcript only")
+            return youtube_transcriber.format_segments(youtube_segments)
         
         # Step 3: Combine using correction model
         if verbose:
             print(f"[Hybrid] Step 3: Correcting with {self.config.OPENAI_CORRECT_MODEL}...")
         
-        corrected_transcript = self.corrector.correct_with_youtube_timestamps(
-            youtube_transcript,
+        corrected_transcript = self.corrector.correct_with_youtube_segments(
+            youtube_segments,
             gpt_transcription,
             verbose=verbose
         )
         
-        return corrected_transcript
\ No newline at end of file
+        return corrected_transcript
+    
+    def _future_result(self, future) -> Tuple[Optional[object], str]:
+        """
+        Return a step's result and a printable failure reason
+        
+        Returns:
+            tuple: (result or None if it raised, ": <error>" or "")
+        """
+        try:
+            return future.result(), ""
+        except Exception as e:
+            return None, f": {e}"
@@ -4,42 +4,20 @@ Summary generation utilities
 
 import os
 import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, Optional, Tuple
 from openai import OpenAI
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 from config import Config
+from .response_cache import ResponseCache
 
 
-def generate_summary(transcript: str, verbose: bool = False) -> Optional[str]:
-    """
-    Generate AI summary of transcript using OpenAI
-    
-    Args:
-        transcript: The transcript text to summarize
-        verbose: Whether to print verbose output
-        
-    Returns:
-        str: Summary text or None if failed
-    """
-    if not Config.OPENAI_API_KEY:
-        if verbose:
-            print("Error: OPENAI_API_KEY not set")
-        return None
-    
-    try:
-        client = OpenAI(api_key=Config.OPENAI_API_KEY)
-        
-        # Get model from config
-        model = Config.OPENAI_SUMMARY_MODEL
-        
-        # Get language preference from config
-        summary_lang = Config.OPENAI_SUMMARY_LANGUAGE
-        
-        # Prepare the prompt
-        system_prompt = """You are a helpful assistant that creates concise, well-structured summaries of video transcripts.
+# Kept byte-identical across calls so the API can reuse the cached prompt prefix
+_SYSTEM_PROMPT_BASE = """You are a helpful assistant that creates concise, well-structured summaries of video transcripts.
 Your summaries should:
 1. Capture the main topics and key points
 2. Be organized with clear sections if the content covers multiple topics
@@ -47,19 +25,9 @@ Your summaries should:
 4. Be written in clear, professional language
 5. Use bullet points for lists when appropriate"""
 
-        # Add language instruction based on preference
-        if summary_lang.lower() == 'auto':
-            # auto - use source language
-            system_prompt += "\n\nProvide the summary in the same language as the source transcript."
-            lang_instruction = ""
-        else:
-            # Use any language specified by user
-            system_prompt += f"\n\nPlease provide the summary in {summary_lang}."
-            lang_instruction = f"in {summary_lang} "
-
-        user_prompt = f"""Please provide {lang_instruction}a comprehensive summary of the following video transcript:
+_TIMECODED_USER_PROMPT = """Please provide {lang_instruction}a comprehensive summary of the following video transcript:
 
-{transcript[:2000000]}  # Limit to ~2M chars to stay within token limits
+{transcript}
 
 요약 형식:
 
@@ -94,30 +62,269 @@ Your summaries should:
 결론 및 권장사항
 - 핵심 메시지 요약"""
 
-        if verbose:
-            print(f"Generating summary with {model}...")
+# Transcript tokens sent to the model (further bounded by the context window)
+_MAX_INPUT_TOKENS = 200000
+
+# Context window (tokens) by model prefix; unknown models get the default
+_CONTEXT_WINDOWS = (
+    ('gpt-5', 400000),
+    ('gpt-4.1', 1047576),
+    ('gpt-4o', 128000),
+)
+_DEFAULT_CONTEXT_WINDOW = 128000
+# Tokens left free for the summary itself (gpt-5 models also spend them on reasoning)
+_RESERVED_OUTPUT_TOKENS = 16000
+
+_response_cache = ResponseCache(Config.RESPONSE_CACHE_PATH, enabled=Config.ENABLE_RESPONSE_CACHE)
+
+# Seconds before a summary request is abandoned (per attempt)
+_REQUEST_TIMEOUT = 300.0
+
+_client: Optional[OpenAI] = None
+_client_key: Optional[str] = None  # API key _client was built with
+_client_lock = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """Load the tiktoken encoding for model (imported lazily); None when unavailable"""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Unknown model name: fall through to the generic encoding below
+        pass
+    except Exception:
+        # Encoding files could not be loaded (e.g. offline first run)
+        return None
+    try:
+        return tiktoken.get_encoding('o200k_base')
+    except Exception:
+        return None
+
+
+def _input_token_budget(model: str, system_prompt: str) -> int:
+    """Tokens available for the transcript in one request"""
+    context_window = _DEFAULT_CONTEXT_WINDOW
+    for prefix, window in _CONTEXT_WINDOWS:
+        if model.startswith(prefix):
+            context_window = window
+            break
+    # UTF-8 byte length is an upper bound on token count
+    prompt_overhead = len(system_prompt.encode('utf-8')) + len(_TIMECODED_USER_PROMPT.encode('utf-8'))
+    return min(context_window - _RESERVED_OUTPUT_TOKENS - prompt_overhead, _MAX_INPUT_TOKENS)
+
+
+def _trim_to_tokens(text: str, model: str, max_tokens: int) -> str:
+    """
+    Cut text to at most max_tokens tokens for model
+    
+    Falls back to a conservative byte cut when the encoding cannot be loaded.
+    """
+    # Every token covers at least one UTF-8 byte, and a character is at most 4 bytes
+    if len(text) * 4 <= max_tokens:
+        return text
+    
+    encoding = _get_encoding(model)
+    if encoding is None:
+        # Every token covers at least one byte, so max_tokens bytes are at most max_tokens tokens
+        return text.encode('utf-8')[:max_tokens].decode('utf-8', errors='ignore')
+    
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
+def _get_client() -> OpenAI:
+    """Return the shared OpenAI client, creating it on first use
+    
+    Reusing one client keeps its HTTP connection pool (and TLS session)
+    alive across summaries instead of reconnecting on every call. The client
+    is rebuilt when Config.OPENAI_API_KEY changes (e.g. after --update-key).
+    """
+    global _client, _client_key
+    api_key = Config.OPENAI_API_KEY
+    with _client_lock:
+        if _client is None or _client_key != api_key:
+            _client = OpenAI(
+                api_key=api_key,
+                max_retries=3,
+                timeout=_REQUEST_TIMEOUT
+            )
+            _client_key = api_key
+        return _client
+
+
+@lru_cache(maxsize=8)
+def _params_template(model: str) -> Dict:
+    """Completion parameters for model, without messages (copy before use)"""
+    # Use appropriate parameter based on model
+    if model.startswith('gpt-5'):
+        # gpt-5 models only support default temperature
+        return {"model": model}
+    return {
+        "model": model,
+        "max_tokens": 1000,
+        "temperature": 0.3,  # Lower temperature for more focused summaries
+    }
+
+
+def _build_request(transcript: str) -> Tuple[str, Dict]:
+    """
+    Build the chat completion request for a summary
+    
+    Returns:
+        tuple: (cache_key, completion_params)
+    """
+    # Get model from config
+    model = Config.OPENAI_SUMMARY_MODEL
+    
+    # Get language preference from config
+    summary_lang = Config.OPENAI_SUMMARY_LANGUAGE
+    
+    # Prepare the prompt
+    system_prompt = _SYSTEM_PROMPT_BASE
+
+    # Add language instruction based on preference
+    if summary_lang.lower() == 'auto':
+        # auto - use source language
+        system_prompt += "\n\nProvide the summary in the same language as the source transcript."
+        lang_instruction = ""
+    else:
+        # Use any language specified by user
+        system_prompt += f"\n\nPlease provide the summary in {summary_lang}."
+        lang_instruction = f"in {summary_lang} "
+
+    user_prompt = _TIMECODED_USER_PROMPT.format(
+        lang_instruction=lang_instruction,
+        transcript=_trim_to_tokens(
+            transcript,
+            model,
+            _input_token_budget(model, system_prompt)
+        )
+    )
+
+    cache_key = ResponseCache.make_key(model, system_prompt, user_prompt)
+    
+    completion_params = dict(_params_template(model))
+    completion_params["messages"] = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt}
+    ]
+    
+    return cache_key, completion_params
+
+
+def generate_summary_stream(transcript: str, verbose: bool = False,
+                            use_cache: bool = True) -> Iterator[str]:
+    """
+    Yield the summary text piece by piece as the model generates it
+    
+    Args:
+        transcript: The transcript text to summarize
+        verbose: Whether to print verbose output
+        use_cache: Reuse a cached summary; when False the fresh summary
+            still replaces the cached one
         
-        # Make API call
-        # Use max_completion_tokens for newer models like gpt-5-mini
-        completion_params = {
-            "model": model,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-        }
+    Yields:
+        str: Summary text fragments (a cached summary is yielded whole)
         
-        # Use appropriate parameter based on model
-        if model.startswith('gpt-5'):
-            # gpt-5 models only support default temperature
-            pass
-        else:
-            completion_params["max_tokens"] = 1000
-            completion_params["temperature"] = 0.3  # Lower temperature for more focused summaries
-            
-        response = client.chat.completions.create(**completion_params)
+    Raises:
+        Exception: API errors are propagated to the caller
+    """
+    cache_key, completion_params = _build_request(transcript)
+    cached_summary = _response_cache.get(cache_key) if use_cache else None
+    if cached_summary is not None:
+        if verbose:
+            print("Using cached summary")
+        yield cached_summary
+        return
+    
+    if verbose:
+        print(f"Generating summary with {completion_params['model']}...")
+    
+    response = _get_client().chat.completions.create(**completion_params, stream=True)
+    
+    parts = []
+    for chunk in response:
+        if not chunk.choices:
+            continue
+        content = chunk.choices[0].delta.content
+        if content:
+            parts.append(content)
+            yield content
+    
+    if parts:
+        _response_cache.put(cache_key, ''.join(parts))
+
+
+def _request_summary(transcript: str, verbose: bool, use_cache: bool) -> Optional[str]:
+    """Generate a summary with one non-streaming request (or the cache); raises on API errors"""
+    cache_key, completion_params = _build_request(transcript)
+    cached_summary = _response_cache.get(cache_key) if use_cache else None
+    if cached_summary is not None:
+        if verbose:
+            print("Using cached summary")
+        return cached_summary
+    
+    if verbose:
+        print(f"Generating summary with {completion_params['model']}...")
+    
+    # Make API call
+    response = _get_client().chat.completions.create(**completion_params)
+    
+    summary = response.choices[0].message.content
+    if summary:
+        _response_cache.put(cache_key, summary)
+    return summary
+
+
+def generate_summary(transcript: str, verbose: bool = False,
+                     stream: bool = False, use_cache: bool = True) -> Optional[str]:
+    """
+    Generate AI summary of transcript using OpenAI
+    
+    Args:
+        transcript: The transcript text to summarize
+        verbose: Whether to print verbose output
+        stream: Print the summary to stdout while it is being generated
+        use_cache: Reuse a cached summary (False for forced re-runs)
         
-        summary = response.choices[0].message.content
+    Returns:
+        str: Summary text or None if failed
+    """
+    if not Config.OPENAI_API_KEY:
+        if verbose:
+            print("Error: OPENAI_API_KEY not set")
+        return None
+    
+    try:
+        if stream:
+            parts = []
+            try:
+                for content in generate_summary_stream(transcript, verbose, use_cache):
+                    parts.append(content)
+                    sys.stdout.write(content)
+                    sys.stdout.flush()
+            except Exception as e:
+                if parts:
+                    # Part of the summary is already on screen; end that line first
+                    print()
+                    raise
+                # Nothing was shown yet: retry once as a plain request
+                if verbose:
+                    print(f"Streaming failed ({e}), retrying without streaming...")
+                parts = [_request_summary(transcript, verbose, use_cache) or '']
+                sys.stdout.write(parts[0])
+            if parts and parts[-1]:
+                print()
+            summary = ''.join(parts) or None
+        else:
+            summary = _request_summary(transcript, verbose, use_cache)
         
         if verbose:
             print("Summary generated successfully")
@@ -12,6 +12,7 @@ from dataclasses import dataclass
 import psutil
 
 from ..config import Config
+from .progress import _CLEAR_LINE, _BARS_40
 
 
 @dataclass
@@ -218,7 +219,10 @@ class ParallelProgressMonitor:
         self.completed = 0
         self.in_progress = {}
         self.chunk_progress = {}  # Track progress within each chunk
-        self.start_time = time.time()
+        self._partial_sum = 0.0  # Sum of chunk_progress over incomplete chunks
+        # All timings use the monotonic clock: elapsed/ETA math only needs
+        # differences, and wall-clock adjustments can't skew them
+        self.start_time = time.monotonic()
         self.lock = threading.Lock()
         self.worker_times = {}
         self.last_display_time = 0
@@ -229,16 +233,25 @@ class ParallelProgressMonitor:
         with self.lock:
             self.in_progress[worker_id] = {
                 'chunk': chunk_index,
-                'start_time': time.time()
+                'start_time': time.monotonic()
             }
-            self.chunk_progress[chunk_index] = 0  # Initialize chunk progress at 0%
+            self._set_chunk_progress(chunk_index, 0)  # Initialize chunk progress at 0%
+    
+    def _set_chunk_progress(self, chunk_index: int, progress: float):
+        """Record chunk progress and keep the partial sum in step (lock held)"""
+        old = self.chunk_progress.get(chunk_index, 100)
+        if old < 100:
+            self._partial_sum -= old
+        if progress < 100:
+            self._partial_sum += progress
+        self.chunk_progress[chunk_index] = progress
     
     def update_chunk_progress(self, chunk_index: int, progress: float):
         """Update progress for a specific chunk (0-100)"""
         with self.lock:
-            self.chunk_progress[chunk_index] = min(100, max(0, progress))
+            self._set_chunk_progress(chunk_index, min(100, max(0, progress)))
             # Only update display if enough time has passed
-            current_time = time.time()
+            current_time = time.monotonic()
             if current_time - self.last_display_time > self.display_interval:
                 self._display_progress()
                 self.last_display_time = current_time
@@ -248,7 +261,7 @@ class ParallelProgressMonitor:
         with self.lock:
             if worker_id in self.in_progress:
                 start_time = self.in_progress[worker_id]['start_time']
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 
                 # Track worker performance
                 if worker_id not in self.worker_times:
@@ -259,20 +272,24 @@ class ParallelProgressMonitor:
             
             # Mark chunk as 100% complete
             if chunk_index in self.chunk_progress:
-                self.chunk_progress[chunk_index] = 100
+                self._set_chunk_progress(chunk_index, 100)
             
             self.completed += 1
-            self._display_progress()
+            # Coalesce bursts of completions into one redraw per display
+            # interval, but always draw the final state before finish()
+            current_time = time.monotonic()
+            if (self.completed >= self.total_chunks
+                    or current_time - self.last_display_time > self.display_interval):
+                self._display_progress()
+                self.last_display_time = current_time
     
     def _display_progress(self):
-        """Display current progress with two-level detail"""
-        elapsed = time.time() - self.start_time
+        """Display current overall progress (including partial chunks)"""
+        elapsed = time.monotonic() - self.start_time
         
-        # Calculate total progress including partial chunks
-        total_progress = self.completed
-        for chunk_idx, progress in self.chunk_progress.items():
-            if progress < 100:  # Only add partial progress for incomplete chunks
-                total_progress += progress / 100.0
+        # Calculate total progress including partial chunks (the partial sum
+        # is maintained incrementally, so this is O(1) per redraw)
+        total_progress = self.completed + self._partial_sum / 100.0
         
         # Calculate overall percentage
         overall_pct = (total_progress / self.total_chunks * 100) if self.total_chunks > 0 else 0
@@ -294,46 +311,24 @@ class ParallelProgressMonitor:
         else:
             eta_str = "calculating..."
         
-        # Build display lines
-        lines = []
-        
         # Overall progress bar
         bar_length = 40
-        filled = int(bar_length * overall_pct / 100)
-        bar = '█' * filled + '░' * (bar_length - filled)
+        filled = min(int(bar_length * overall_pct / 100), bar_length)
+        bar = _BARS_40[filled]
         
         # Main status line (convert speed to per minute for readability)
         speed_per_min = speed * 60 if speed > 0 else 0
         main_line = (f"Overall: [{bar}] {overall_pct:.1f}% ({total_progress:.1f}/{self.total_chunks} chunks) | "
                     f"Speed: {speed_per_min:.2f} chunks/min | ETA: {eta_str}")
         
-        # Worker details (only show active workers)
-        worker_lines = []
-        for worker_id, info in self.in_progress.items():
-            chunk_idx = info['chunk']
-            chunk_pct = self.chunk_progress.get(chunk_idx, 0)
-            # Mini progress bar for each worker
-            mini_bar_length = 10
-            mini_filled = int(mini_bar_length * chunk_pct / 100)
-            mini_bar = '█' * mini_filled + '░' * (mini_bar_length - mini_filled)
-            worker_lines.append(f"  Worker {worker_id % 1000:02d}: Chunk {chunk_idx + 1:3d} [{mini_bar}] {chunk_pct:3.0f}%")
-        
-        # Clear previous lines and print new ones
-        # Use \r to return to start of line, then clear with spaces
-        clear_line = ' ' * 100
-        
-        # Print main line
-        print(f"\r{clear_line}\r{main_line}", end='', flush=True)
-        
-        # If we have active workers and verbose mode, show them on next lines
-        if worker_lines and len(self.in_progress) > 0:
-            # Note: Multi-line progress is tricky in terminal, keeping single line for now
-            # Could be enhanced with terminal control codes later
-            pass
+        # Clear previous line and print the new one in a single write.
+        # Per-worker detail lines are not built: multi-line progress is
+        # tricky in terminal, so only the overall line is shown for now
+        print(_CLEAR_LINE + main_line, end='', flush=True)
     
     def finish(self):
         """Finalize progress display"""
-        elapsed = time.time() - self.start_time
+        elapsed = time.monotonic() - self.start_time
         elapsed_min = int(elapsed / 60)
         elapsed_sec = int(elapsed % 60)
         
@@ -453,14 +448,14 @@ class WorkerPool:
         worker_id = threading.get_ident()
         progress.start_chunk(worker_id, index)
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             # Call processor function
             # Expected signature: processor_func(chunk, index) -> text
             text = processor_func(chunk, index)
             
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
             
             progress.complete_chunk(worker_id, index)
             
@@ -472,7 +467,7 @@ class WorkerPool:
             )
             
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
             progress.complete_chunk(worker_id, index)
             
             return ChunkResult(
@@ -0,0 +1,58 @@
+"""
+Tests for src/utils/summary.py
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("openai")
+
+from src.utils import summary
+from src.utils.response_cache import ResponseCache
+
+
+class _FakeCompletions:
+    """Records requests and answers each with a fixed summary"""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.calls = 0
+
+    def create(self, **params):
+        self.calls += 1
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def completions(monkeypatch, tmp_path):
+    """Fresh on-disk cache and a fake client for every test"""
+    fake = _FakeCompletions("fresh summary")
+    client = SimpleNamespace(chat=SimpleNamespace(completions=fake))
+    monkeypatch.setattr(summary.Config, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(summary, "_response_cache", ResponseCache(tmp_path))
+    monkeypatch.setattr(summary, "_get_client", lambda: client)
+    return fake
+
+
+def _seed_cache(transcript: str, cached: str):
+    cache_key, _ = summary._build_request(transcript)
+    summary._response_cache.put(cache_key, cached)
+
+
+def test_cached_summary_is_reused(completions):
+    _seed_cache("transcript", "cached summary")
+
+    assert summary.generate_summary("transcript") == "cached summary"
+    assert completions.calls == 0
+
+
+def test_forced_run_skips_cache(completions):
+    _seed_cache("transcript", "cached summary")
+
+    assert summary.generate_summary("transcript", use_cache=False) == "fresh summary"
+    assert completions.calls == 1
+    # The fresh summary replaces the stale entry for later runs
+    assert summary.generate_summary("transcript") == "fresh summary"
+    assert completions.calls == 1